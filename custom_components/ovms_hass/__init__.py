@@ -19,6 +19,7 @@ Configuration via configuration.yaml:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
 from typing import Final
@@ -35,6 +36,7 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 
@@ -54,6 +56,7 @@ DEFAULT_HOST: Final = "api.openvehicles.com"
 DEFAULT_PORT: Final = 6869
 DEFAULT_SCAN_INTERVAL: Final = 300
 CONF_VEHICLE_PASSWORD: Final = "vehicle_password"
+CONF_DISCOVER_VEHICLE_ID: Final = "discover_vehicle_id"
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -139,42 +142,181 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up OVMS from a config entry.
+async def _async_acquire_api_client(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> OVMSApiClient:
+    """Return a connected API client for the entry's server account.
+
+    Vehicles on the same account share one client, so they reuse a single
+    login session and HTTP connection pool instead of one per entry. The
+    password is part of the key, so an entry with changed credentials gets a
+    client of its own instead of a session logged in with the old ones.
 
     Args:
         hass: Home Assistant instance
         entry: Config entry
 
     Returns:
-        True if setup was successful
+        Connected OVMS API client
+
+    Raises:
+        OVMSAuthenticationError: If login fails
+        OVMSConnectionError: If the server cannot be reached
     """
-    try:
-        # Create API client (always create new instance per entry)
+    host = entry.data.get(CONF_HOST, DEFAULT_HOST)
+    port = entry.data.get(CONF_PORT, DEFAULT_PORT)
+    key = (host, port, entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    clients = domain_data.setdefault("api_clients", {})
+    lock = domain_data.setdefault("api_clients_lock", asyncio.Lock())
+
+    # Entries set up concurrently must not each log in and overwrite the other
+    async with lock:
+        shared = clients.get(key)
+        if shared is not None:
+            shared["refs"] += 1
+            return shared["client"]
+
         api_client = OVMSApiClient(
-            host=entry.data.get(CONF_HOST, DEFAULT_HOST),
+            host=host,
             username=entry.data[CONF_USERNAME],
             password=entry.data[CONF_PASSWORD],
-            port=entry.data.get(CONF_PORT, DEFAULT_PORT),
+            port=port,
             use_https=True,
         )
+        await api_client.connect()
+        _LOGGER.info("Connected to OVMS server %s", host)
+        clients[key] = {"client": api_client, "refs": 1}
+        return api_client
+
+
+async def _async_release_api_client(
+    hass: HomeAssistant, api_client: OVMSApiClient
+) -> None:
+    """Drop an entry's reference to a shared API client.
+
+    The client is disconnected when the last entry using it releases it.
+
+    Args:
+        hass: Home Assistant instance
+        api_client: Client returned by _async_acquire_api_client
+    """
+    clients = hass.data.get(DOMAIN, {}).get("api_clients", {})
+    for key, shared in clients.items():
+        if shared["client"] is api_client:
+            shared["refs"] -= 1
+            if shared["refs"] > 0:
+                return
+            del clients[key]
+            break
+    await api_client.disconnect()
+
+
+async def _async_discover_vehicle_id(
+    hass: HomeAssistant, entry: ConfigEntry, api_client: OVMSApiClient
+) -> None:
+    """Store the account's first vehicle on an entry created without one.
+
+    The config flow skips vehicle discovery so the form completes without an
+    extra round trip; this runs once on first setup and persists the result.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry flagged for vehicle discovery
+        api_client: Connected API client
+
+    Raises:
+        ConfigEntryNotReady: If the vehicle list could not be fetched
+        ConfigEntryError: If the vehicle is already configured by another entry
+    """
+    try:
+        vehicles = await api_client.list_vehicles()
+    except (OVMSConnectionError, OVMSAPIError) as err:
+        raise ConfigEntryNotReady(f"Could not list OVMS vehicles: {err}") from err
+
+    data = {**entry.data}
+    data.pop(CONF_DISCOVER_VEHICLE_ID)
+    if not vehicles:
+        _LOGGER.warning("No vehicles found for OVMS account %s", data[CONF_USERNAME])
+        hass.config_entries.async_update_entry(entry, data=data)
+        return
+
+    vehicle_id = vehicles[0].id
+    _LOGGER.info("Discovered OVMS vehicle %s", vehicle_id)
+
+    # The flow keyed this entry on the account, so it could not tell that the
+    # vehicle was already configured; refuse to set it up a second time
+    existing = hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, vehicle_id)
+    if existing is not None and existing is not entry:
+        raise ConfigEntryError(
+            f"OVMS vehicle {vehicle_id} is already configured by entry "
+            f"'{existing.title}'; remove this duplicate entry"
+        )
+
+    data["vehicle_id"] = vehicle_id
+    hass.config_entries.async_update_entry(
+        entry, data=data, title=f"OVMS {vehicle_id}", unique_id=vehicle_id
+    )
 
-        # Connect to OVMS server
-        try:
-            await api_client.connect()
-            _LOGGER.info(
-                "Connected to OVMS server %s", entry.data.get(CONF_HOST, DEFAULT_HOST)
-            )
-        except OVMSAuthenticationError as err:
-            _LOGGER.error("OVMS authentication failed: %s", err)
-            return False
-        except OVMSConnectionError as err:
-            _LOGGER.error(
-                "Failed to connect to OVMS server %s: %s",
-                entry.data.get(CONF_HOST, DEFAULT_HOST),
-                err,
-            )
-            return False
+
+async def _async_abort_setup(
+    hass: HomeAssistant,
+    coordinator: OVMSDataCoordinator | None,
+    api_client: OVMSApiClient,
+) -> None:
+    """Undo a partial entry setup so a retry starts clean.
+
+    Args:
+        hass: Home Assistant instance
+        coordinator: Coordinator created before setup failed, if any
+        api_client: Client returned by _async_acquire_api_client
+    """
+    if coordinator is not None:
+        await coordinator.async_shutdown()
+        coordinators = hass.data.get(DOMAIN, {}).get("coordinators", {})
+        if coordinators.get(coordinator.vehicle_id) is coordinator:
+            del coordinators[coordinator.vehicle_id]
+        if coordinator.ovms_client:
+            try:
+                await coordinator.ovms_client.disconnect()
+            except (OVMSConnectionError, OVMSAPIError) as err:
+                _LOGGER.debug("Error disconnecting protocol client: %s", err)
+    try:
+        await _async_release_api_client(hass, api_client)
+    except (OVMSConnectionError, OVMSAPIError) as err:
+        _LOGGER.debug("Error disconnecting API client: %s", err)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up OVMS from a config entry.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+
+    Returns:
+        True if setup was successful
+    """
+    # Get the API client for this account (shared by its vehicles)
+    try:
+        api_client = await _async_acquire_api_client(hass, entry)
+    except OVMSAuthenticationError as err:
+        _LOGGER.error("OVMS authentication failed: %s", err)
+        return False
+    except OVMSConnectionError as err:
+        _LOGGER.error(
+            "Failed to connect to OVMS server %s: %s",
+            entry.data.get(CONF_HOST, DEFAULT_HOST),
+            err,
+        )
+        return False
+
+    # Everything below holds a reference to the shared client, so any failure
+    # has to give it back or the client is never disconnected
+    coordinator: OVMSDataCoordinator | None = None
+    try:
+        if entry.data.get(CONF_DISCOVER_VEHICLE_ID):
+            await _async_discover_vehicle_id(hass, entry, api_client)
 
         # Create coordinator
         # Use entry ID as vehicle_id if not explicitly set for consistent unique_ids
@@ -199,6 +341,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "coordinator": coordinator,
             "api_client": api_client,
         }
+        # Index by vehicle so service calls find their coordinator directly
+        hass.data[DOMAIN].setdefault("coordinators", {})[vehicle_id] = coordinator
 
         # Set up Protocol v2 client for commands
         # Use vehicle_password for Protocol v2 if available, otherwise fall back to password
@@ -260,13 +404,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     except OVMSAuthenticationError as err:
         _LOGGER.error("OVMS authentication error: %s", err)
-        return False
     except OVMSConnectionError as err:
         _LOGGER.error("OVMS connection error: %s", err)
-        return False
+    except Exception:
+        # Not ready, duplicate vehicle or unexpected: clean up, let HA handle it
+        await _async_abort_setup(hass, coordinator, api_client)
+        raise
     else:
         return True
 
+    await _async_abort_setup(hass, coordinator, api_client)
+    return False
+
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update options.
@@ -284,11 +433,9 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
             entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
         )
 
-        if (
-            coordinator.update_interval
-            and coordinator.update_interval.total_seconds() != new_scan_interval
-        ):
-            coordinator.update_interval = timedelta(seconds=new_scan_interval)
+        if coordinator.base_update_interval.total_seconds() != new_scan_interval:
+            coordinator.base_update_interval = timedelta(seconds=new_scan_interval)
+            coordinator.update_interval = coordinator.base_update_interval
             await coordinator.async_request_refresh()
     except (OVMSConnectionError, OVMSAPIError):
         _LOGGER.exception("Error updating OVMS options")
@@ -312,17 +459,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         try:
             # Clean up protocol client first
             coordinator = entry.runtime_data.get("coordinator")
+            if coordinator:
+                # Stops scheduled refreshes and background revalidation
+                await coordinator.async_shutdown()
+                coordinators = hass.data.get(DOMAIN, {}).get("coordinators", {})
+                if coordinators.get(coordinator.vehicle_id) is coordinator:
+                    del coordinators[coordinator.vehicle_id]
             if coordinator and coordinator.ovms_client:
                 try:
                     await coordinator.ovms_client.disconnect()
                 except (OVMSConnectionError, OVMSAPIError) as err:
                     _LOGGER.debug("Error disconnecting protocol client: %s", err)
 
-            # Clean up API client
+            # Release API client (disconnects once no entry uses it)
             api_client = entry.runtime_data.get("api_client")
             if api_client:
                 try:
-                    await api_client.disconnect()
+                    await _async_release_api_client(hass, api_client)
                 except (OVMSConnectionError, OVMSAPIError) as err:
                     _LOGGER.debug("Error disconnecting API client: %s", err)
 
@@ -16,11 +16,17 @@ from dataclasses import dataclass, fields
 import json
 import logging
 import re
-from typing import Any, Self, TypeVar, get_args
+from typing import Any, Self, TypeVar, get_args, get_type_hints
 
 import aiohttp
 from yarl import URL
 
+try:
+    # Shipped with Home Assistant; much faster than the stdlib parser
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -58,6 +64,38 @@ def _convert_value(value: Any, target_type: type) -> Any:
     return value
 
 
+# Conversion target per dataclass field, resolved once per class
+_FIELD_TYPES: dict[type, dict[str, type | None]] = {}
+
+
+def _field_types(cls: type) -> dict[str, type | None]:
+    """Return the conversion target type for each field of a dataclass.
+
+    Annotations are postponed (strings) in this module, so they are resolved
+    with get_type_hints. Optional[T] fields map to T; other fields map to None
+    and are passed through unconverted. The result is cached per class.
+
+    Args:
+        cls: Dataclass type
+
+    Returns:
+        Mapping of field name to target type (or None for no conversion)
+    """
+    field_types = _FIELD_TYPES.get(cls)
+    if field_types is None:
+        hints = get_type_hints(cls)
+        field_types = {}
+        for field in fields(cls):
+            field_type = hints[field.name]
+            type_args = get_args(field_type)
+            # Get the non-None type from Optional[T]
+            field_types[field.name] = next(
+                (t for t in type_args if t is not type(None)), None
+            )
+        _FIELD_TYPES[cls] = field_types
+    return field_types
+
+
 def _from_dict_with_type_conversion(cls: type[T], data: dict) -> T:
     """Create dataclass instance from dict with proper type conversion.
 
@@ -68,31 +106,24 @@ def _from_dict_with_type_conversion(cls: type[T], data: dict) -> T:
     Returns:
         Instance of the dataclass with properly typed fields
     """
-    supported_fields = {field.name: field.type for field in fields(cls)}  # type: ignore[arg-type]
+    field_types = _field_types(cls)
     filtered_data = {}
 
     for key, value in data.items():
-        if key not in supported_fields or value is None:
+        if value is None or key not in field_types:
             continue
 
-        field_type = supported_fields[key]
-
-        # Handle Optional types by extracting the actual type
-        if hasattr(field_type, "__args__"):
-            # Get the non-None type from Optional[T]
-            type_args = get_args(field_type)
-            actual_type = next((t for t in type_args if t is not type(None)), None)
-
-            if actual_type:
-                try:
-                    filtered_data[key] = _convert_value(value, actual_type)
-                except (ValueError, TypeError) as e:
-                    _LOGGER.debug(
-                        "Failed to convert %s=%s to %s: %s", key, value, actual_type, e
-                    )
-                    continue
-        else:
+        actual_type = field_types[key]
+        if actual_type is None:
             filtered_data[key] = value
+            continue
+
+        try:
+            filtered_data[key] = _convert_value(value, actual_type)
+        except (ValueError, TypeError) as e:
+            _LOGGER.debug(
+                "Failed to convert %s=%s to %s: %s", key, value, actual_type, e
+            )
 
     return cls(**filtered_data)
 
@@ -438,7 +469,7 @@ class OVMSApiClient:
                 cookies=cookies,
                 ssl=False,
             ) as response:
-                text = await response.text()
+                body = await response.read()
 
                 _LOGGER.debug("Response status: %d", response.status)
 
@@ -466,13 +497,15 @@ class OVMSApiClient:
                 if response.status == 502:
                     raise OVMSAPIError("Bad gateway (paranoid vehicle?)")
                 if response.status >= 400:
-                    raise OVMSAPIError(f"HTTP {response.status}: {text}")
+                    raise OVMSAPIError(
+                        f"HTTP {response.status}: {body.decode('utf-8', 'replace')}"
+                    )
 
                 # Try to parse JSON, fallback to text
                 try:
-                    return json.loads(text)
-                except json.JSONDecodeError:
-                    return {"text": text}
+                    return _json_loads(body)
+                except ValueError:
+                    return {"text": body.decode("utf-8", "replace")}
 
         except TimeoutError as e:
             raise OVMSConnectionError(f"Request timeout: {e}") from e
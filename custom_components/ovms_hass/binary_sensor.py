@@ -27,6 +27,32 @@ from .entities import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity classes created for every vehicle. Whether an entity starts
+# enabled is set on the class itself.
+_BINARY_SENSORS = (
+    # Door sensors (enabled by default - security relevant)
+    FrontLeftDoorSensor,
+    FrontRightDoorSensor,
+    RearLeftDoorSensor,  # Disabled by default
+    RearRightDoorSensor,  # Disabled by default
+    # Hood/Trunk (enabled by default - security relevant)
+    BonnetSensor,
+    TrunkSensor,
+    # Charge port (enabled by default - useful for charging workflows)
+    ChargePortSensor,
+    # Vehicle state sensors
+    PilotPresentSensor,  # Enabled - useful for charging
+    CarOnSensor,  # Enabled - useful for automations
+    AlarmSensor,  # Enabled - security relevant
+    HVACSensor,  # Enabled - climate control status
+    # Less common sensors (disabled by default)
+    ParkingBrakeSensor,  # Disabled
+    HeadlightsSensor,  # Disabled
+    GPSLockSensor,  # Disabled
+    # Diagnostic sensors (disabled by default)
+    CanWriteSensor,  # Disabled
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -36,33 +62,5 @@ async def async_setup_entry(
     """Set up binary sensor entities."""
     coordinator: OVMSDataCoordinator = config_entry.runtime_data["coordinator"]
 
-    entities = [
-        # Door sensors (enabled by default - security relevant)
-        FrontLeftDoorSensor(coordinator, coordinator.vehicle_id),
-        FrontRightDoorSensor(coordinator, coordinator.vehicle_id),
-        RearLeftDoorSensor(coordinator, coordinator.vehicle_id),  # Disabled by default
-        RearRightDoorSensor(coordinator, coordinator.vehicle_id),  # Disabled by default
-
-        # Hood/Trunk (enabled by default - security relevant)
-        BonnetSensor(coordinator, coordinator.vehicle_id),
-        TrunkSensor(coordinator, coordinator.vehicle_id),
-
-        # Charge port (enabled by default - useful for charging workflows)
-        ChargePortSensor(coordinator, coordinator.vehicle_id),
-
-        # Vehicle state sensors
-        PilotPresentSensor(coordinator, coordinator.vehicle_id),  # Enabled - useful for charging
-        CarOnSensor(coordinator, coordinator.vehicle_id),  # Enabled - useful for automations
-        AlarmSensor(coordinator, coordinator.vehicle_id),  # Enabled - security relevant
-        HVACSensor(coordinator, coordinator.vehicle_id),  # Enabled - climate control status
-
-        # Less common sensors (disabled by default)
-        ParkingBrakeSensor(coordinator, coordinator.vehicle_id),  # Disabled
-        HeadlightsSensor(coordinator, coordinator.vehicle_id),  # Disabled
-        GPSLockSensor(coordinator, coordinator.vehicle_id),  # Disabled
-
-        # Diagnostic sensors (disabled by default)
-        CanWriteSensor(coordinator, coordinator.vehicle_id),  # Disabled
-    ]
-
-    async_add_entities(entities)
+    vid = coordinator.vehicle_id
+    async_add_entities([entity_cls(coordinator, vid) for entity_cls in _BINARY_SENSORS])
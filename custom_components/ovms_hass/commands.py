@@ -9,6 +9,7 @@ with RC4 encryption and HMAC-MD5 authentication for message integrity.
 
 from dataclasses import dataclass
 from enum import IntEnum
+from sys import intern
 
 
 class CommandCode(IntEnum):
@@ -59,7 +60,39 @@ class CommandCode(IntEnum):
     MODEM_COMMAND = 49
 
 
-@dataclass
+# "MP-0 C<code>" prefix for every known code, keyed by int (IntEnum hashes alike)
+_PREFIXES = {code.value: f"MP-0 C{code.value}" for code in CommandCode}
+
+# Command strings that never change are built once at import time
+_COOLDOWN = f"MP-0 C{CommandCode.COOLDOWN.value}"
+_START_CHARGE = f"MP-0 C{CommandCode.START_CHARGE.value}"
+_STOP_CHARGE = f"MP-0 C{CommandCode.STOP_CHARGE.value}"
+_LOCK_CAR = f"MP-0 C{CommandCode.LOCK_CAR.value}"
+_UNLOCK_CAR = f"MP-0 C{CommandCode.UNLOCK_CAR.value}"
+_ENABLE_VALET_MODE = f"MP-0 C{CommandCode.SET_VALET_MODE.value}"
+_DISABLE_VALET_MODE = f"MP-0 C{CommandCode.CLEAR_VALET_MODE.value}"
+_WAKEUP_CAR = f"MP-0 C{CommandCode.WAKEUP_CAR.value}"
+_REBOOT_MODULE = f"MP-0 C{CommandCode.REBOOT.value}"
+
+# Prefixes for single-parameter commands
+_SET_CHARGE_CURRENT_PREFIX = f"MP-0 C{CommandCode.SET_CHARGE_CURRENT.value},"
+_HOMELINK_PREFIX = f"MP-0 C{CommandCode.HOME_LINK.value},"
+_SET_CHARGE_PARAMETERS_PREFIX = f"MP-0 C{CommandCode.SET_CHARGE_PARAMETERS.value},"
+_WAKEUP_SUBSYSTEM_PREFIX = f"MP-0 C{CommandCode.WAKEUP_SUBSYSTEM.value},"
+_GENERIC_COMMAND_PREFIX = f"MP-0 C{CommandCode.GENERIC_COMMAND.value},"
+
+# Climate commands: SQ vehicles use homelink timing (0=5min) to start and a
+# generic command to stop, standard vehicles use command 26 with 1/0
+_CLIMATE_ON_STD = f"MP-0 C{CommandCode.CLIMATE_CONTROL.value},1"
+_CLIMATE_OFF_STD = f"MP-0 C{CommandCode.CLIMATE_CONTROL.value},0"
+_CLIMATE_ON_SQ = f"{_HOMELINK_PREFIX}0"
+_CLIMATE_OFF_SQ = f"{_GENERIC_COMMAND_PREFIX}climate off"
+
+# Command and result codes in responses are small non-negative integers
+_SMALL_INTS = {str(i): i for i in range(100)}
+
+
+@dataclass(frozen=True, slots=True)
 class CommandResponse:
     """Response from a vehicle command."""
 
@@ -72,8 +105,10 @@ class CommandResponse:
     message: str
     """Response message from vehicle"""
 
-    is_success: bool
-    """True if result code is 0 (success)"""
+    @property
+    def is_success(self) -> bool:
+        """True if result code is 0 (success)."""
+        return self.result_code == 0
 
     @classmethod
     def parse(cls, response_str: str) -> "CommandResponse":
@@ -87,16 +122,24 @@ class CommandResponse:
         Returns:
             CommandResponse object
         """
-        parts = response_str.lstrip("c").split(",", 2)
-        code = int(parts[0]) if len(parts) > 0 else 0
-        result_code = int(parts[1]) if len(parts) > 1 else -1
-        message = parts[2] if len(parts) > 2 else ""
+        if response_str.startswith("c"):
+            response_str = response_str[1:]
+        code_str, _, rest = response_str.partition(",")
+        result_str, _, message = rest.partition(",")
+        code = _SMALL_INTS.get(code_str)
+        if code is None:
+            code = int(code_str)
+        result_code = _SMALL_INTS.get(result_str)
+        if result_code is None:
+            result_code = int(result_str) if result_str else -1
+        # Short messages ("OK", error phrases) repeat, so share one copy of each
+        if len(message) <= 16:
+            message = intern(message)
 
         return cls(
             code=code,
             result_code=result_code,
             message=message,
-            is_success=result_code == 0,
         )
 
 
@@ -106,6 +149,8 @@ class OVMSCommandBuilder:
     Commands follow the format: "MP-0 C<code>[,<param1>[,<param2>...]]"
     """
 
+    __slots__ = ()
+
     @staticmethod
     def build_command(code: int, *params: str | int) -> str:
         """Build a Protocol v2 command string.
@@ -117,11 +162,15 @@ class OVMSCommandBuilder:
         Returns:
             Formatted command string ready for transmission
         """
-        param_str = ",".join(str(p) for p in params) if params else ""
-        command = f"MP-0 C{code}"
-        if param_str:
-            command += f",{param_str}"
-        return command
+        prefix = _PREFIXES.get(code)
+        if prefix is None:
+            prefix = f"MP-0 C{code}"
+        n = len(params)
+        if n == 0:
+            return prefix
+        if n == 1:
+            return f"{prefix},{params[0]}"
+        return f"{prefix},{','.join(map(str, params))}"
 
     @staticmethod
     def climate_on(vehicle_type: str = "standard") -> str:
@@ -133,11 +182,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for AC ON
         """
-        if vehicle_type.lower() == "sq":
-            # SQ vehicles use command 24 with timing (0=5min, 1=10min, 2=15min)
-            return OVMSCommandBuilder.build_command(CommandCode.HOME_LINK, 0)
-        # Standard vehicles use command 26 with parameter 1
-        return OVMSCommandBuilder.build_command(CommandCode.CLIMATE_CONTROL, 1)
+        return _CLIMATE_ON_SQ if vehicle_type.lower() == "sq" else _CLIMATE_ON_STD
 
     @staticmethod
     def climate_off(vehicle_type: str = "standard") -> str:
@@ -149,11 +194,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for AC OFF
         """
-        if vehicle_type.lower() == "sq":
-            # SQ vehicles use a different approach
-            return OVMSCommandBuilder.build_command(CommandCode.GENERIC_COMMAND, "climate off")
-        # Standard vehicles use command 26 with parameter 0
-        return OVMSCommandBuilder.build_command(CommandCode.CLIMATE_CONTROL, 0)
+        return _CLIMATE_OFF_SQ if vehicle_type.lower() == "sq" else _CLIMATE_OFF_STD
 
     @staticmethod
     def cooldown() -> str:
@@ -162,7 +203,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for cooldown activation
         """
-        return OVMSCommandBuilder.build_command(CommandCode.COOLDOWN)
+        return _COOLDOWN
 
     @staticmethod
     def start_charge() -> str:
@@ -171,7 +212,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for start charge
         """
-        return OVMSCommandBuilder.build_command(CommandCode.START_CHARGE)
+        return _START_CHARGE
 
     @staticmethod
     def stop_charge() -> str:
@@ -180,7 +221,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for stop charge
         """
-        return OVMSCommandBuilder.build_command(CommandCode.STOP_CHARGE)
+        return _STOP_CHARGE
 
     @staticmethod
     def set_charge_limit(soc_percent: int) -> str:
@@ -193,7 +234,7 @@ class OVMSCommandBuilder:
             Command string for set charge limit
         """
         soc_percent = max(0, min(100, soc_percent))
-        return OVMSCommandBuilder.build_command(CommandCode.SET_CHARGE_PARAMETERS, soc_percent)
+        return f"{_SET_CHARGE_PARAMETERS_PREFIX}{soc_percent}"
 
     @staticmethod
     def set_charge_current(amps: int) -> str:
@@ -205,7 +246,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for set charge current
         """
-        return OVMSCommandBuilder.build_command(CommandCode.SET_CHARGE_CURRENT, amps)
+        return f"{_SET_CHARGE_CURRENT_PREFIX}{amps}"
 
     @staticmethod
     def lock_car() -> str:
@@ -214,7 +255,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for lock car
         """
-        return OVMSCommandBuilder.build_command(CommandCode.LOCK_CAR)
+        return _LOCK_CAR
 
     @staticmethod
     def unlock_car() -> str:
@@ -223,7 +264,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for unlock car
         """
-        return OVMSCommandBuilder.build_command(CommandCode.UNLOCK_CAR)
+        return _UNLOCK_CAR
 
     @staticmethod
     def enable_valet_mode() -> str:
@@ -232,7 +273,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for enable valet mode
         """
-        return OVMSCommandBuilder.build_command(CommandCode.SET_VALET_MODE)
+        return _ENABLE_VALET_MODE
 
     @staticmethod
     def disable_valet_mode() -> str:
@@ -241,7 +282,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for disable valet mode
         """
-        return OVMSCommandBuilder.build_command(CommandCode.CLEAR_VALET_MODE)
+        return _DISABLE_VALET_MODE
 
     @staticmethod
     def wakeup_car() -> str:
@@ -250,7 +291,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for wakeup car
         """
-        return OVMSCommandBuilder.build_command(CommandCode.WAKEUP_CAR)
+        return _WAKEUP_CAR
 
     @staticmethod
     def wakeup_subsystem(subsystem: str) -> str:
@@ -262,7 +303,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for wakeup subsystem
         """
-        return OVMSCommandBuilder.build_command(CommandCode.WAKEUP_SUBSYSTEM, subsystem)
+        return f"{_WAKEUP_SUBSYSTEM_PREFIX}{subsystem}"
 
     @staticmethod
     def homelink(button: int = 0) -> str:
@@ -274,7 +315,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for homelink activation
         """
-        return OVMSCommandBuilder.build_command(CommandCode.HOME_LINK, button)
+        return f"{_HOMELINK_PREFIX}{button}"
 
     @staticmethod
     def reboot_module() -> str:
@@ -283,7 +324,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for module reset
         """
-        return OVMSCommandBuilder.build_command(CommandCode.REBOOT)
+        return _REBOOT_MODULE
 
     @staticmethod
     def generic_command(command_text: str) -> str:
@@ -295,7 +336,7 @@ class OVMSCommandBuilder:
         Returns:
             Command string for generic command
         """
-        return OVMSCommandBuilder.build_command(CommandCode.GENERIC_COMMAND, command_text)
+        return f"{_GENERIC_COMMAND_PREFIX}{command_text}"
 
 
 class ClimateControlCommand:
@@ -305,6 +346,8 @@ class ClimateControlCommand:
     and command code 24 for SQ vehicles.
     """
 
+    __slots__ = ("vehicle_type", "is_sq", "_on", "_off", "_status")
+
     def __init__(self, vehicle_type: str = "standard"):
         """Initialize climate control for specific vehicle type.
 
@@ -313,18 +356,27 @@ class ClimateControlCommand:
         """
         self.vehicle_type = vehicle_type.lower()
         self.is_sq = self.vehicle_type == "sq"
+        if self.is_sq:
+            self._on = _CLIMATE_ON_SQ
+            self._off = _CLIMATE_OFF_SQ
+            self._status = OVMSCommandBuilder.generic_command("schedule status")
+        else:
+            self._on = _CLIMATE_ON_STD
+            self._off = _CLIMATE_OFF_STD
+            # Query the v.e.hvac metric to get actual HVAC status
+            self._status = OVMSCommandBuilder.generic_command("metrics get v.e.hvac")
 
     def turn_on(self) -> str:
         """Command to turn on AC/climate control."""
-        return OVMSCommandBuilder.climate_on(self.vehicle_type)
+        return self._on
 
     def turn_off(self) -> str:
         """Command to turn off AC/climate control."""
-        return OVMSCommandBuilder.climate_off(self.vehicle_type)
+        return self._off
 
     def cooldown(self) -> str:
         """Command to activate battery/cabin cooldown."""
-        return OVMSCommandBuilder.cooldown()
+        return _COOLDOWN
 
     def get_status_command(self) -> str:
         """Get status command for climate control.
@@ -332,24 +384,23 @@ class ClimateControlCommand:
         Returns:
             Command to query climate control status (v.e.hvac metric)
         """
-        if self.is_sq:
-            return OVMSCommandBuilder.generic_command("schedule status")
-        # Query the v.e.hvac metric to get actual HVAC status
-        return OVMSCommandBuilder.generic_command("metrics get v.e.hvac")
+        return self._status
 
 
 class ChargingCommand:
     """Convenience class for vehicle charging commands."""
 
+    __slots__ = ()
+
     @staticmethod
     def start() -> str:
         """Command to start charging."""
-        return OVMSCommandBuilder.start_charge()
+        return _START_CHARGE
 
     @staticmethod
     def stop() -> str:
         """Command to stop charging."""
-        return OVMSCommandBuilder.stop_charge()
+        return _STOP_CHARGE
 
     @staticmethod
     def set_limit(soc_percent: int) -> str:
@@ -373,26 +424,30 @@ class ChargingCommand:
 class LockCommand:
     """Convenience class for door lock commands."""
 
+    __slots__ = ()
+
     @staticmethod
     def lock() -> str:
         """Command to lock vehicle doors and ignition."""
-        return OVMSCommandBuilder.lock_car()
+        return _LOCK_CAR
 
     @staticmethod
     def unlock() -> str:
         """Command to unlock vehicle doors and ignition."""
-        return OVMSCommandBuilder.unlock_car()
+        return _UNLOCK_CAR
 
 
 class ValetModeCommand:
     """Convenience class for valet mode commands."""
 
+    __slots__ = ()
+
     @staticmethod
     def enable() -> str:
         """Command to enable valet mode restrictions."""
-        return OVMSCommandBuilder.enable_valet_mode()
+        return _ENABLE_VALET_MODE
 
     @staticmethod
     def disable() -> str:
         """Command to disable valet mode restrictions."""
-        return OVMSCommandBuilder.disable_valet_mode()
+        return _DISABLE_VALET_MODE
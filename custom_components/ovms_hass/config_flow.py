@@ -29,6 +29,27 @@ DEFAULT_PORT = 6869
 DEFAULT_SCAN_INTERVAL = 300
 CONF_VEHICLE_ID = "vehicle_id"
 CONF_VEHICLE_PASSWORD = "vehicle_password"
+CONF_DISCOVER_VEHICLE_ID = "discover_vehicle_id"
+
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST, default=DEFAULT_HOST): cv.string,
+        vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.port,
+        vol.Required(CONF_USERNAME): cv.string,
+        vol.Required(CONF_PASSWORD): cv.string,
+        vol.Optional(CONF_VEHICLE_ID): cv.string,
+        vol.Optional(CONF_VEHICLE_PASSWORD): cv.string,
+    }
+)
+
+# The current interval is filled in as a suggested value when the form is shown
+_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=60, max=3600)
+        ),
+    }
+)
 
 
 class OVMSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -95,6 +116,10 @@ class OVMSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not host or not username or not password:
                 errors["base"] = "missing_credentials"
             else:
+                # Abort before connecting if this vehicle/account is already set up
+                await self.async_set_unique_id(vehicle_id or f"{host}:{username}")
+                self._abort_if_unique_id_configured()
+
                 # Try to connect to validate credentials
                 try:
                     api_client = OVMSApiClient(
@@ -105,23 +130,12 @@ class OVMSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         use_https=True,
                     )
                     await api_client.connect()
-
-                    # If vehicle_id not provided, try to get first vehicle from list
-                    if not vehicle_id:
-                        try:
-                            vehicles = await api_client.list_vehicles()
-                            if vehicles:
-                                vehicle_id = vehicles[0].id
-                                user_input[CONF_VEHICLE_ID] = vehicle_id
-                        except Exception as err:
-                            _LOGGER.debug("Could not list vehicles: %s", err)
-
                     await api_client.disconnect()
 
-                    # Set unique ID based on vehicle_id or host:username
-                    unique_id = vehicle_id if vehicle_id else f"{host}:{username}"
-                    await self.async_set_unique_id(unique_id)
-                    self._abort_if_unique_id_configured()
+                    # Without a vehicle_id, the first vehicle on the account is
+                    # looked up once during setup instead of here
+                    if not vehicle_id:
+                        user_input[CONF_DISCOVER_VEHICLE_ID] = True
 
                     title = f"OVMS {vehicle_id}" if vehicle_id else f"OVMS ({host})"
                     return self.async_create_entry(
@@ -138,16 +152,7 @@ class OVMSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST, default=DEFAULT_HOST): cv.string,
-                    vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.port,
-                    vol.Required(CONF_USERNAME): cv.string,
-                    vol.Required(CONF_PASSWORD): cv.string,
-                    vol.Optional(CONF_VEHICLE_ID): cv.string,
-                    vol.Optional(CONF_VEHICLE_PASSWORD): cv.string,
-                }
-            ),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -164,15 +169,13 @@ class OVMSOptionsFlowHandler(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
+            data_schema=self.add_suggested_values_to_schema(
+                _OPTIONS_SCHEMA,
                 {
-                    vol.Optional(
+                    CONF_SCAN_INTERVAL: self.config_entry.options.get(
                         CONF_SCAN_INTERVAL,
-                        default=self.config_entry.options.get(
-                            CONF_SCAN_INTERVAL,
-                            self.config_entry.data.get("scan_interval", DEFAULT_SCAN_INTERVAL),
-                        ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
-                }
+                        self.config_entry.data.get("scan_interval", DEFAULT_SCAN_INTERVAL),
+                    ),
+                },
             ),
         )
@@ -13,10 +13,13 @@ The Protocol v2 TCP connection includes:
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from contextlib import suppress
 from datetime import timedelta
+from functools import partial
 import logging
 import ssl
+import time
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -24,13 +27,65 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 
 from .api import OVMSApiClient, OVMSAPIError, OVMSConnectionError
 
+# cryptography (declared in manifest.json, and shipped with Home Assistant)
+# gives OpenSSL's RC4; without it the pure-Python RC4 class is used
+try:
+    from cryptography.exceptions import UnsupportedAlgorithm as _UnsupportedAlgorithm
+    from cryptography.hazmat.primitives.ciphers import Cipher as _Cipher
+
+    try:
+        from cryptography.hazmat.decrepit.ciphers.algorithms import ARC4 as _ARC4
+    except ImportError:  # cryptography < 43
+        from cryptography.hazmat.primitives.ciphers.algorithms import ARC4 as _ARC4
+except ImportError:
+    _Cipher = None
+
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SCAN_INTERVAL = 300  # 5 minutes
+ACTIVE_SCAN_INTERVAL = 30  # seconds, while driving or charging
+WAKE_SCAN_INTERVAL = 15  # seconds, right after a wake-up command
+WAKE_BOOST_DURATION = 300  # seconds to keep polling fast after a wake-up
 COMMAND_TIMEOUT = 10  # seconds
 PING_INTERVAL = 300  # 5 minutes
 RECONNECT_DELAY = 3  # seconds before reconnect attempt
 
+# Charge states in which the vehicle counts as active; plugged in but done or
+# stopped does not, so an idle module is left to sleep
+ACTIVE_CHARGE_STATES = ("charging", "heating")
+
+# Connection counters returned by the /api/vehicle/<VEHICLEID> endpoint
+VEHICLE_CONNECTION_KEYS = ("v_net_connected", "v_apps_connected", "v_btcs_connected")
+
+# Status values the vehicle reports as negative when they are not set
+UNSET_IF_NEGATIVE_KEYS = ("servicerange", "servicetime")
+
+# Minimum seconds between fetches for sections that change slowly; other
+# sections are fetched every update interval
+SECTION_TTLS: dict[str, int] = {
+    "tpms": 900,  # tyre pressures drift slowly
+    "vehicle": 600,  # server connection counts
+}
+
+# Shared by all Protocol v2 connections; SSLContext is safe to reuse
+_SSL_CONTEXT: ssl.SSLContext | None = None
+
+
+async def _async_get_ssl_context() -> ssl.SSLContext:
+    """Return the shared SSL context, creating it on first use.
+
+    Loading the system trust store blocks, so the context is created in the
+    executor once and reused for every subsequent connect.
+
+    Returns:
+        Default client SSL context
+    """
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        loop = asyncio.get_running_loop()
+        _SSL_CONTEXT = await loop.run_in_executor(None, ssl.create_default_context)
+    return _SSL_CONTEXT
+
 
 class OVMSDataCoordinator(DataUpdateCoordinator):
     """Coordinator to manage OVMS data fetching and updates.
@@ -62,7 +117,11 @@ class OVMSDataCoordinator(DataUpdateCoordinator):
         )
         self.api_client = api_client
         self.vehicle_id = vehicle_id
+        # Configured interval; update_interval drops below it while active
+        self.base_update_interval = timedelta(seconds=scan_interval)
         self.ovms_client: OVMSProtocolClient | None = None
+        # Section dicts are created once and only updated in place, so
+        # entities can index them directly
         self.data: dict[str, Any] = {
             "vehicle_id": vehicle_id,
             "vehicle_name": vehicle_id,
@@ -70,78 +129,240 @@ class OVMSDataCoordinator(DataUpdateCoordinator):
             "charge": {},
             "location": {},
             "tpms": {},
-            "features": {},
             "vehicle": {},
         }
+        # Direct references to the section dicts for entities
+        self.status: dict[str, Any] = self.data["status"]
+        self.charge: dict[str, Any] = self.data["charge"]
+        self.location: dict[str, Any] = self.data["location"]
+        self.vehicle: dict[str, Any] = self.data["vehicle"]
+        # Monotonic time each section was last fetched successfully
+        self._fetched_at: dict[str, float] = {}
+        # Background revalidation of cached sections, if one is in flight
+        self._revalidate_task: asyncio.Task | None = None
+        # Await every section on the next update instead of serving cache
+        self._fetch_all = False
+        # Serializes Protocol v2 commands
+        self._command_lock = asyncio.Lock()
+        # Monotonic deadline of the fast polling window after a wake-up
+        self._boost_until = 0.0
+
+    def _section_fetches(self) -> dict[str, Callable[[], Awaitable[Any]]]:
+        """Return the fetch function for each data section.
+
+        Returns:
+            Mapping of section name to a function that starts the fetch
+        """
+        return {
+            "status": partial(self.api_client.get_status, self.vehicle_id),
+            "charge": partial(self.api_client.get_charge, self.vehicle_id),
+            "location": partial(self.api_client.get_location, self.vehicle_id),
+            "tpms": partial(self.api_client.get_tpms, self.vehicle_id),
+            "vehicle": self._fetch_vehicle_connection,
+        }
+
+    def _store_section(self, name: str, result: Any, max_age: float) -> None:
+        """Store a fetch result, keeping the last good value on failure.
+
+        Args:
+            name: Section name in self.data
+            result: Fetched object/dict, or the exception the fetch raised
+            max_age: Seconds a previous value may still be served after a failure
+        """
+        if isinstance(result, BaseException):
+            _LOGGER.debug(
+                "Failed to fetch %s for %s: %s",
+                name,
+                self.vehicle_id,
+                result,
+            )
+            fetched_at = self._fetched_at.get(name)
+            if fetched_at is None or time.monotonic() - fetched_at >= max_age:
+                self.data[name].clear()
+            return
+
+        # Update the section dict in place so its identity is stable across polls
+        section = self.data[name]
+        # Dataclass responses expose their fields via __dict__; dicts have none
+        values = getattr(result, "__dict__", result)
+        if values is not section:
+            section.clear()
+            section.update(values)
+        if name == "status":
+            # Normalize once here rather than on every state read
+            for key in UNSET_IF_NEGATIVE_KEYS:
+                value = section.get(key)
+                if value is not None and value < 0:
+                    section[key] = None
+        self._fetched_at[name] = time.monotonic()
+
+    def _merge_protocol_data(self) -> None:
+        """Merge data from Protocol v2 messages (F, D, etc.) into status.
+
+        These fill in fields not available via the REST API
+        (e.g., HVAC from D message, GSM signal from F message).
+        """
+        if self.ovms_client and self.ovms_client.protocol_data:
+            for key, value in self.ovms_client.protocol_data.items():
+                if value is not None:
+                    self.data["status"][key] = value
+
+    def _adapt_update_interval(self) -> None:
+        """Poll faster while the vehicle is on, driving or charging.
+
+        Data changes quickly while the vehicle is active, so the interval is
+        shortened to ACTIVE_SCAN_INTERVAL; otherwise the configured interval
+        is used. Within WAKE_BOOST_DURATION of a wake-up command the interval
+        is WAKE_SCAN_INTERVAL. The coordinator picks up the new interval on
+        its next tick.
+        """
+        status = self.data["status"]
+        active = (
+            status.get("caron") is True
+            or (status.get("speed") or 0) > 0
+            or status.get("charging") is True
+            or self.data["charge"].get("chargestate") in ACTIVE_CHARGE_STATES
+        )
+        base = self.base_update_interval.total_seconds()
+        if time.monotonic() < self._boost_until and base > WAKE_SCAN_INTERVAL:
+            interval = timedelta(seconds=WAKE_SCAN_INTERVAL)
+        elif active and base > ACTIVE_SCAN_INTERVAL:
+            interval = timedelta(seconds=ACTIVE_SCAN_INTERVAL)
+        else:
+            interval = self.base_update_interval
+        if interval != self.update_interval:
+            _LOGGER.debug(
+                "Vehicle %s %s, polling every %s",
+                self.vehicle_id,
+                "active" if active else "idle",
+                interval,
+            )
+            self.update_interval = interval
+
+    def boost_update_interval(self) -> None:
+        """Poll every WAKE_SCAN_INTERVAL for a while after waking the vehicle.
+
+        The vehicle reports fresh data shortly after waking up, so the window
+        lasts WAKE_BOOST_DURATION; afterwards the interval follows the
+        vehicle's activity again.
+        """
+        self._boost_until = time.monotonic() + WAKE_BOOST_DURATION
+        self._adapt_update_interval()
+
+    async def async_request_fresh_refresh(self) -> None:
+        """Request a refresh that fetches every section instead of using cache.
+
+        Used when the user expects current data, e.g. after a command or a
+        manual refresh, where cached sections would show the state from before.
+        """
+        self._fetch_all = True
+        await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel background revalidation and stop scheduled refreshes."""
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+            self._revalidate_task = None
+        await super().async_shutdown()
+
+    def _store_results(
+        self, fetches: dict[str, Any], results: list[Any], max_ages: dict[str, float]
+    ) -> bool:
+        """Store fetch results and derived data.
+
+        Args:
+            fetches: Fetched sections, in the order of results
+            results: Fetched objects/dicts, or the exceptions the fetches raised
+            max_ages: Staleness bound per section passed to _store_section
+
+        Returns:
+            True if at least one fetch succeeded
+        """
+        for name, result in zip(fetches, results):
+            self._store_section(name, result, max_ages[name])
+        self._merge_protocol_data()
+        self._adapt_update_interval()
+        return not all(isinstance(result, BaseException) for result in results)
+
+    async def _async_revalidate(
+        self, fetches: dict[str, Awaitable[Any]], max_ages: dict[str, float]
+    ) -> None:
+        """Refresh cached sections in the background and notify entities once.
+
+        If every fetch failed, the next update awaits all sections so that the
+        failure is reported through UpdateFailed.
+
+        Args:
+            fetches: Started fetch per section
+            max_ages: Staleness bound per section passed to _store_section
+        """
+        try:
+            results = await asyncio.gather(*fetches.values(), return_exceptions=True)
+        finally:
+            if self._revalidate_task is asyncio.current_task():
+                self._revalidate_task = None
+        if not self._store_results(fetches, results, max_ages):
+            self._fetch_all = True
+            return
+        self.async_set_updated_data(self.data)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from OVMS API.
 
+        Sections listed in SECTION_TTLS are skipped until their TTL expires.
+        Sections fetched within the last two configured intervals (or TTLs) are
+        served from cache and revalidated together in one background task, so
+        a slow endpoint does not hold up the others. Older or never-fetched
+        sections are awaited, as is every section for a fresh refresh.
+
         Returns:
             Dictionary containing all vehicle data
 
         Raises:
-            UpdateFailed: If connection to OVMS fails
+            UpdateFailed: If connection to OVMS fails, or every awaited section
+                failed with none left to revalidate
         """
+        fetch_all, self._fetch_all = self._fetch_all, False
+        if fetch_all and self._revalidate_task is not None:
+            # Its results would predate the data awaited below
+            self._revalidate_task.cancel()
+            self._revalidate_task = None
+
         try:
-            # Fetch vehicle status data in parallel for efficiency
-            status_task = self.api_client.get_status(self.vehicle_id)
-            charge_task = self.api_client.get_charge(self.vehicle_id)
-            location_task = self.api_client.get_location(self.vehicle_id)
-            tpms_task = self.api_client.get_tpms(self.vehicle_id)
-            features_task = self._fetch_features()
-            vehicle_task = self._fetch_vehicle_connection()
-
-            status, charge, location, tpms, features, vehicle = await asyncio.gather(
-                status_task,
-                charge_task,
-                location_task,
-                tpms_task,
-                features_task,
-                vehicle_task,
-                return_exceptions=True,
-            )
+            interval = self.base_update_interval.total_seconds()
+            now = time.monotonic()
+            awaited: dict[str, Awaitable[Any]] = {}
+            revalidated: dict[str, Awaitable[Any]] = {}
+            max_ages: dict[str, float] = {}
+
+            for name, fetch in self._section_fetches().items():
+                ttl = SECTION_TTLS.get(name, 0)
+                fetched_at = self._fetched_at.get(name)
+                max_age = 2 * max(interval, ttl)
+                if fetch_all or fetched_at is None or now - fetched_at >= max_age:
+                    awaited[name] = fetch()
+                elif now - fetched_at < ttl:
+                    continue  # Still fresh, skip the request entirely
+                elif self._revalidate_task is None:
+                    revalidated[name] = fetch()
+                else:
+                    continue  # Already being revalidated
+                max_ages[name] = max_age
 
-            # Update data dictionary with results, filtering out exceptions
-            self.data["status"] = (
-                status.__dict__ if not isinstance(status, Exception) else {}
-            )
-            self.data["charge"] = (
-                charge.__dict__ if not isinstance(charge, Exception) else {}
-            )
-            self.data["location"] = (
-                location.__dict__ if not isinstance(location, Exception) else {}
-            )
-            self.data["tpms"] = tpms.__dict__ if not isinstance(tpms, Exception) else {}
-            self.data["features"] = (
-                features if not isinstance(features, Exception) else {}
-            )
-            self.data["vehicle"] = vehicle if not isinstance(vehicle, Exception) else {}
-
-            # Merge data from Protocol v2 messages (F, D, etc.)
-            # These fill in fields not available via the REST API
-            # (e.g., HVAC from D message, GSM signal from F message)
-            if self.ovms_client and self.ovms_client.protocol_data:
-                for key, value in self.ovms_client.protocol_data.items():
-                    if value is not None:
-                        self.data["status"][key] = value
-
-            # Log any exceptions that occurred (not as errors, just debug)
-            for task_name, result in [
-                ("status", status),
-                ("charge", charge),
-                ("location", location),
-                ("tpms", tpms),
-                ("features", features),
-                ("vehicle", vehicle),
-            ]:
-                if isinstance(result, Exception):
-                    _LOGGER.debug(
-                        "Failed to fetch %s for %s: %s",
-                        task_name,
-                        self.vehicle_id,
-                        result,
-                    )
+            if revalidated:
+                self._revalidate_task = self.hass.async_create_background_task(
+                    self._async_revalidate(revalidated, max_ages),
+                    f"{self.name} revalidate",
+                )
+
+            # Fetch stale sections in parallel for efficiency
+            results = await asyncio.gather(*awaited.values(), return_exceptions=True)
+            if (
+                not self._store_results(awaited, results, max_ages)
+                and results
+                and not revalidated
+            ):
+                raise UpdateFailed(f"Failed to fetch data from OVMS: {results[0]}")
 
             return self.data
 
@@ -150,49 +371,20 @@ class OVMSDataCoordinator(DataUpdateCoordinator):
         except OVMSAPIError as err:
             raise UpdateFailed(f"OVMS API error: {err}") from err
 
-    async def _fetch_features(self) -> dict[int, str]:
-        """Fetch vehicle features via command 1.
-
-        Returns:
-            Dictionary mapping feature slot to value
-        """
-        if not self.ovms_client:
-            return {}
-
-        try:
-            # Send command 1 to request features
-            # Response format: "MP-0 c1,0,fn,fm,fv" where fn=feature number, fm=max features, fv=value
-            # We'll parse the response to build features dict
-            # For now, return empty dict as feature parsing requires response handling
-            # This will be populated when we receive feature responses
-            return self.data.get("features", {})
-        except (OVMSConnectionError, OVMSAPIError) as err:
-            _LOGGER.debug("Failed to fetch features: %s", err)
-            return {}
-
     async def _fetch_vehicle_connection(self) -> dict[str, int]:
         """Fetch vehicle connection status from API.
 
+        Errors propagate like those of the other sections, so a failed fetch
+        keeps the last counters until they go stale instead of reporting zeros.
+
         Returns:
             Dictionary with v_net_connected, v_apps_connected, v_btcs_connected
         """
-        try:
-            # The /api/vehicle/<VEHICLEID> endpoint returns connection info
-            response = await self.api_client.get_vehicle(self.vehicle_id)
-            return {
-                "v_net_connected": response.get("v_net_connected", 0),
-                "v_apps_connected": response.get("v_apps_connected", 0),
-                "v_btcs_connected": response.get("v_btcs_connected", 0),
-            }
-        except (OVMSConnectionError, OVMSAPIError) as err:
-            _LOGGER.debug("Failed to fetch vehicle connection: %s", err)
-            return {
-                "v_net_connected": 0,
-                "v_apps_connected": 0,
-                "v_btcs_connected": 0,
-            }
-
-    async def async_send_command(self, command: str) -> bool:
+        # The /api/vehicle/<VEHICLEID> endpoint returns connection info
+        response = await self.api_client.get_vehicle(self.vehicle_id)
+        return {key: response.get(key, 0) for key in VEHICLE_CONNECTION_KEYS}
+
+    async def async_send_command(self, command: str, refresh: bool = True) -> bool:
         """Send a command to the vehicle via Protocol v2.
 
         Ensures the connection is alive before sending, waits for the actual
@@ -200,6 +392,7 @@ class OVMSDataCoordinator(DataUpdateCoordinator):
 
         Args:
             command: Command string (e.g., "26,1" for AC ON)
+            refresh: Whether to request a data refresh after a successful command
 
         Returns:
             True if command was sent and acknowledged successfully
@@ -222,8 +415,9 @@ class OVMSDataCoordinator(DataUpdateCoordinator):
         )
 
         try:
-            timeout = asyncio.timeout(COMMAND_TIMEOUT)
-            async with timeout:
+            # One command in flight at a time, so each response is matched to
+            # the command that produced it
+            async with self._command_lock, asyncio.timeout(COMMAND_TIMEOUT):
                 _LOGGER.info("Coordinator: Calling ovms_client.send_command(%s)", command)
                 await self.ovms_client.send_command(command)
                 _LOGGER.info("Coordinator: Command sent, waiting for command response...")
@@ -254,11 +448,6 @@ class OVMSDataCoordinator(DataUpdateCoordinator):
                         "(command may still have been forwarded to vehicle)",
                         command,
                     )
-
-                # Refresh data after command execution
-                _LOGGER.debug("Coordinator: Triggering data refresh after command")
-                await self.async_request_refresh()
-                return True
         except TimeoutError:
             _LOGGER.error(
                 "Coordinator: Command timeout after %d seconds: %s",
@@ -278,6 +467,13 @@ class OVMSDataCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Coordinator: API error sending command %s: %s", command, err)
             return False
 
+        if refresh:
+            # Refresh data after command execution; the debouncer merges bursts
+            # of commands into a single refresh
+            _LOGGER.debug("Coordinator: Requesting data refresh after command")
+            await self.async_request_fresh_refresh()
+        return True
+
     async def _ensure_protocol_connection(self) -> bool:
         """Ensure the Protocol v2 TCP connection is alive, reconnecting if needed.
 
@@ -292,10 +488,7 @@ class OVMSDataCoordinator(DataUpdateCoordinator):
 
         _LOGGER.info("Coordinator: Protocol v2 connection is down, attempting reconnect...")
         try:
-            await self.ovms_client.disconnect()
-            await self.ovms_client.connect()
-            # Start background reader for the new connection
-            self.ovms_client.start_background_reader()
+            await self.ovms_client.ensure_connected()
             _LOGGER.info("Coordinator: Protocol v2 reconnected successfully")
             return True
         except (OVMSConnectionError, OVMSAPIError) as err:
@@ -307,7 +500,11 @@ class OVMSDataCoordinator(DataUpdateCoordinator):
 
 
 class RC4:
-    """RC4 stream cipher implementation for OVMS Protocol v2."""
+    """RC4 stream cipher implementation for OVMS Protocol v2.
+
+    Pure-Python fallback used when OpenSSL's RC4 is unavailable; see
+    _OpenSSLRC4 for the fast path.
+    """
 
     def __init__(self, key: bytes) -> None:
         """Initialize RC4 cipher with key.
@@ -347,6 +544,50 @@ class RC4:
         return bytes(result)
 
 
+class _OpenSSLRC4:
+    """RC4 stream cipher backed by OpenSSL through the cryptography package."""
+
+    def __init__(self, key: bytes) -> None:
+        """Initialize RC4 cipher with key.
+
+        Args:
+            key: Encryption key bytes
+
+        Raises:
+            UnsupportedAlgorithm: If the OpenSSL build has no RC4
+        """
+        # RC4 is symmetric, so one encryptor handles both directions
+        self._context = _Cipher(_ARC4(key), mode=None).encryptor()
+
+    def crypt(self, data: bytes) -> bytes:
+        """Encrypt or decrypt data using RC4.
+
+        Args:
+            data: Data to encrypt/decrypt
+
+        Returns:
+            Encrypted/decrypted data
+        """
+        return self._context.update(data)
+
+
+def _new_rc4(key: bytes) -> RC4 | _OpenSSLRC4:
+    """Create an RC4 cipher, preferring OpenSSL over the pure-Python one.
+
+    Args:
+        key: Encryption key bytes
+
+    Returns:
+        RC4 cipher ready to encrypt/decrypt
+    """
+    if _Cipher is not None:
+        try:
+            return _OpenSSLRC4(key)
+        except _UnsupportedAlgorithm:
+            _LOGGER.debug("OpenSSL RC4 unavailable, using pure-Python RC4")
+    return RC4(key)
+
+
 class OVMSProtocolClient:
     """OVMS Protocol v2 client with RC4 encryption and HMAC-MD5 authentication.
 
@@ -393,17 +634,21 @@ class OVMSProtocolClient:
         self.authenticated = False
         self._reader: Any | None = None
         self._writer: Any | None = None
-        self._tx_cipher: RC4 | None = None
-        self._rx_cipher: RC4 | None = None
+        self._tx_cipher: RC4 | _OpenSSLRC4 | None = None
+        self._rx_cipher: RC4 | _OpenSSLRC4 | None = None
         self._token: str = ""
         # Background tasks
         self._reader_task: asyncio.Task | None = None
         self._ping_task: asyncio.Task | None = None
         # Command response handling
         self._command_response: dict[str, Any] | None = None
+        # Code of the command awaiting a response, so stale responses are ignored
+        self._expected_code: int | None = None
         self._command_event: asyncio.Event = asyncio.Event()
         # Lock to prevent concurrent command sends
         self._command_lock: asyncio.Lock = asyncio.Lock()
+        # Lock so concurrent callers share a single reconnect
+        self._connect_lock: asyncio.Lock = asyncio.Lock()
         # Data parsed from Protocol v2 messages (F, D, etc.)
         self.protocol_data: dict[str, Any] = {}
 
@@ -430,15 +675,10 @@ class OVMSProtocolClient:
             )
 
             if self.use_tls:
-                # Pre-create SSL context outside the event loop to avoid blocking call
-                loop = asyncio.get_event_loop()
-                ssl_context = await loop.run_in_executor(
-                    None, ssl.create_default_context
-                )
                 reader, writer = await asyncio.open_connection(
                     self.host,
                     self.port,
-                    ssl=ssl_context,
+                    ssl=await _async_get_ssl_context(),
                 )
             else:
                 reader, writer = await asyncio.open_connection(
@@ -540,8 +780,8 @@ class OVMSProtocolClient:
             _LOGGER.debug("Derived crypto key from: %s", server_client_token)
 
             # Initialize RC4 ciphers (same key for both directions)
-            self._tx_cipher = RC4(crypto_key)
-            self._rx_cipher = RC4(crypto_key)
+            self._tx_cipher = _new_rc4(crypto_key)
+            self._rx_cipher = _new_rc4(crypto_key)
 
             # Prime the ciphers with 1024 zero bytes
             # This discards the first 1024 bytes of keystream for security
@@ -591,9 +831,30 @@ class OVMSProtocolClient:
         self._tx_cipher = None
         self._rx_cipher = None
         self._command_response = None
+        self._expected_code = None
         self._command_event.clear()
         _LOGGER.debug("Disconnected from OVMS server")
 
+    async def ensure_connected(self) -> None:
+        """Reconnect and restart the background reader if the connection is down.
+
+        The connection is kept open between commands; this only does work after
+        it has dropped. Concurrent callers wait for the same reconnect.
+
+        Raises:
+            OVMSConnectionError: If reconnecting fails
+        """
+        if self.connected and self.authenticated:
+            return
+
+        async with self._connect_lock:
+            if self.connected and self.authenticated:
+                return
+            _LOGGER.info("Protocol v2 connection is down, reconnecting")
+            await self.disconnect()
+            await self.connect()
+            self.start_background_reader()
+
     def start_background_reader(self) -> None:
         """Start the background reader loop and ping timer.
 
@@ -635,7 +896,8 @@ class OVMSProtocolClient:
                         _LOGGER.warning("Background reader: Connection closed by server (EOF)")
                         break
 
-                    response = data.decode("utf-8").strip()
+                    # Frames are base64 lines; b64decode takes the bytes as-is
+                    response = data.rstrip(b"\r\n")
                     if not response:
                         continue
 
@@ -716,6 +978,17 @@ class OVMSProtocolClient:
             "result": int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else None,
             "message": parts[2] if len(parts) > 2 else "",
         }
+        if (
+            self._expected_code is not None
+            and response["code"] is not None
+            and response["code"] != self._expected_code
+        ):
+            _LOGGER.debug(
+                "Ignoring response for command %s while waiting for %s",
+                response["code"],
+                self._expected_code,
+            )
+            return
         self._command_response = response
         self._command_event.set()
 
@@ -795,16 +1068,15 @@ class OVMSProtocolClient:
             Command response dict with 'code', 'result', 'message' keys,
             or None if timeout
         """
-        # Clear any previous response
-        self._command_event.clear()
-        self._command_response = None
-
-        try:
-            await asyncio.wait_for(self._command_event.wait(), timeout=timeout)
+        # send_command() already cleared the previous response; clearing here
+        # would drop a response that arrived before this call
+        with suppress(TimeoutError):
+            async with asyncio.timeout(timeout):
+                await self._command_event.wait()
             return self._command_response
-        except TimeoutError:
-            _LOGGER.debug("Timed out waiting for command response after %ds", timeout)
-            return None
+
+        _LOGGER.debug("Timed out waiting for command response after %ds", timeout)
+        return None
 
     async def _ping_loop(self) -> None:
         """Send periodic ping messages to keep the connection alive.
@@ -865,11 +1137,11 @@ class OVMSProtocolClient:
         encrypted = self._tx_cipher.crypt(message.encode("utf-8"))
         return base64.b64encode(encrypted).decode("ascii")
 
-    def _decrypt_message(self, encoded: str) -> str:
+    def _decrypt_message(self, encoded: str | bytes) -> str:
         """Decrypt a base64 encoded RC4 encrypted message.
 
         Args:
-            encoded: Base64 encoded encrypted message
+            encoded: Base64 encoded encrypted message (text or raw line bytes)
 
         Returns:
             Decrypted plaintext message
@@ -883,6 +1155,19 @@ class OVMSProtocolClient:
         decrypted = self._rx_cipher.crypt(encrypted)
         return decrypted.decode("utf-8", errors="replace")
 
+    @staticmethod
+    def parse_command(command: str) -> tuple[int | None, str]:
+        """Split a command string into its code and arguments.
+
+        Args:
+            command: Command string (e.g., "26,1")
+
+        Returns:
+            Tuple of (code, arguments); code is None if not numeric
+        """
+        code, _, args = command.partition(",")
+        return (int(code) if code.isdigit() else None), args
+
     async def send_command(self, command: str) -> None:
         """Send command to vehicle.
 
@@ -894,25 +1179,22 @@ class OVMSProtocolClient:
             command: Command string (e.g., "26,1" for climate ON)
 
         Raises:
-            OVMSConnectionError: If not connected or send fails
+            OVMSConnectionError: If reconnecting or sending fails
         """
-        if not self.connected or not self._writer:
-            _LOGGER.error("Cannot send command - not connected to OVMS server")
-            raise OVMSConnectionError("Not connected to OVMS server")
-
-        if not self.authenticated or not self._tx_cipher:
-            _LOGGER.error("Cannot send command - not authenticated")
-            raise OVMSConnectionError("Not authenticated with OVMS server")
+        # Reuse the open connection; only reconnects if it has dropped
+        await self.ensure_connected()
 
         # Build the command message
         message = f"MP-0 C{command}"
         _LOGGER.debug("Sending command: %s", message)
+        code, _ = self.parse_command(command)
 
         try:
             async with self._command_lock:
                 # Clear any previous command response before sending
                 self._command_event.clear()
                 self._command_response = None
+                self._expected_code = code
                 await self._send_encrypted_message(message)
             _LOGGER.debug("Command sent successfully")
         except Exception as err:
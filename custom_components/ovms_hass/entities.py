@@ -8,9 +8,9 @@ corresponding vehicle feature appropriately within Home Assistant.
 from __future__ import annotations
 
 from abc import ABC
-import asyncio
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -39,12 +39,22 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import OVMSConnectionError
+
 _LOGGER = logging.getLogger(__name__)
 
+# Marks an entity that does not track a single coordinator value, or one
+# whose state has not been written yet
+_MISSING = object()
+
+# Marks a value whose key is absent from its coordinator section
+_ABSENT = object()
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EntityConfig:
     """Configuration for an entity."""
 
@@ -61,6 +71,36 @@ class EntityConfig:
     """Unit of measurement for sensors"""
 
 
+@lru_cache(maxsize=32)
+def _unique_id_prefix(vehicle_id: str) -> str:
+    """Return the unique ID prefix shared by all entities of a vehicle.
+
+    Every entity of a vehicle needs the same value, so it is computed once.
+
+    Args:
+        vehicle_id: OVMS vehicle ID
+
+    Returns:
+        "ovms_<vehicle_id>_" with spaces and special characters in the vehicle
+        ID replaced by "_"
+    """
+    safe_vehicle_id = "".join(c if c.isalnum() else "_" for c in vehicle_id)
+    return f"ovms_{safe_vehicle_id}_"
+
+
+@lru_cache(maxsize=32)
+def _device_identifiers(vehicle_id: str) -> frozenset[tuple[str, str]]:
+    """Return the device registry identifiers of a vehicle.
+
+    Args:
+        vehicle_id: OVMS vehicle ID
+
+    Returns:
+        Identifiers shared by all entities of the vehicle
+    """
+    return frozenset({("ovms", vehicle_id)})
+
+
 class OVMSEntity(CoordinatorEntity, ABC):
     """Base class for OVMS entities.
 
@@ -70,34 +110,84 @@ class OVMSEntity(CoordinatorEntity, ABC):
     _attr_should_poll = False
     _attr_has_entity_name = True
 
+    # Coordinator update status and value the state was last written from
+    _last_value: Any = _MISSING
+
+    # Suffix of the unique ID; subclasses with a fixed configuration set this
+    # together with _attr_name and _attr_icon instead of passing an EntityConfig
+    _entity_key: str
+
     def __init__(
         self,
         coordinator: Any,
-        config: EntityConfig,
         vehicle_id: str,
+        config: EntityConfig | None = None,
     ) -> None:
         """Initialize OVMS entity.
 
         Args:
             coordinator: Data coordinator for updates
-            config: Entity configuration
             vehicle_id: OVMS vehicle ID
+            config: Entity configuration, if not declared on the class
         """
         super().__init__(coordinator)
-        self.vehicle_id = vehicle_id
-        # Sanitize vehicle_id for use in unique_id (remove spaces and special chars)
-        safe_vehicle_id = "".join(c if c.isalnum() else "_" for c in vehicle_id)
-        self._attr_unique_id = f"ovms_{safe_vehicle_id}_{config.unique_id}"
-        self._attr_name = config.name
-        if config.icon:
-            self._attr_icon = config.icon
-        if config.unit_of_measurement:
-            self._attr_native_unit_of_measurement = config.unit_of_measurement
+        if config is not None:
+            self._entity_key = config.unique_id
+            self._attr_name = config.name
+            if config.icon:
+                self._attr_icon = config.icon
+            if config.unit_of_measurement:
+                self._attr_native_unit_of_measurement = config.unit_of_measurement
+        self._attr_unique_id = _unique_id_prefix(vehicle_id) + self._entity_key
+        # Home Assistant registers the device when the entity is added; the
+        # first refresh has completed by then
+        self._attr_device_info = self._build_device_info()
+        self._update_from_data()
+
+    @property
+    def vehicle_id(self) -> str:
+        """Return the OVMS vehicle ID, shared by all entities of a coordinator."""
+        return self.coordinator.vehicle_id
+
+    def _update_from_data(self) -> None:
+        """Update state attributes derived from coordinator data.
+
+        Called on creation and on every coordinator update, for entities that
+        set ``_attr_*`` values once instead of computing them in properties.
+        """
 
-    @property
-    def device_info(self) -> dict:
-        """Return device info for device registry."""
-        status = self.coordinator.data.get("status", {})
+    def _read_value(self) -> Any:
+        """Return the single coordinator value the state is derived from.
+
+        Entities overriding this only write their state when the value or the
+        coordinator's update status changed. The default returns _MISSING, so
+        the state is written on every coordinator update.
+        """
+        return _MISSING
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        Most values change far less often than the coordinator polls, so the
+        write is skipped while an entity's value is unchanged.
+        """
+        value = self._read_value()
+        if value is not _MISSING:
+            value = (self.coordinator.last_update_success, value)
+            if value == self._last_value:
+                return
+            self._last_value = value
+        self._update_from_data()
+        super()._handle_coordinator_update()
+
+    def _build_device_info(self) -> dict:
+        """Build device info for the device registry from the current status.
+
+        Returns:
+            Device info dict
+        """
+        status = self.coordinator.status
 
         # Get device information from API
         car_type = status.get("car_type") or "Unknown"
@@ -106,7 +196,7 @@ class OVMSEntity(CoordinatorEntity, ABC):
         vin = status.get("car_vin")
 
         device_info = {
-            "identifiers": {("ovms", self.vehicle_id)},
+            "identifiers": _device_identifiers(self.vehicle_id),
             "name": self.vehicle_id,
             "manufacturer": "OVMS",
             "model": f"{car_type} Vehicle Monitor"
@@ -125,6 +215,141 @@ class OVMSEntity(CoordinatorEntity, ABC):
         return device_info
 
 
+@lru_cache(maxsize=64)
+def _parse_timestamp(value: str) -> datetime | None:
+    """Parse an OVMS message timestamp.
+
+    The same timestamp is read on every state update until the module
+    reports again, so parsed values are cached.
+
+    Args:
+        value: Timestamp as reported by the server ("YYYY-MM-DD HH:MM:SS")
+
+    Returns:
+        UTC-aware datetime, or None if the value cannot be parsed
+    """
+    try:
+        # Parse ISO format timestamp and make it UTC aware
+        dt = datetime.fromisoformat(value.replace(" ", "T"))
+    except (ValueError, AttributeError):
+        return None
+    # If timezone-naive, assume UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt
+
+
+def _bucket_key_entity(
+    base: type,
+    value_property: str,
+    class_name: str,
+    doc: str,
+    bucket: str,
+    key: str,
+    config: EntityConfig,
+    attrs: dict[str, Any],
+) -> type:
+    """Create an entity class whose state is a single coordinator value.
+
+    Each instance keeps a reference to its section dict, which the coordinator
+    updates in place, so reading the state is a single lookup.
+
+    Args:
+        base: Home Assistant entity platform class
+        value_property: Name of the state property of the platform class
+        class_name: Name of the generated class
+        doc: Docstring of the generated class
+        bucket: Coordinator data section holding the value
+        key: Key of the value within the section
+        config: Entity configuration of the generated class
+        attrs: Additional class attributes such as ``_attr_*`` defaults
+
+    Returns:
+        Entity class taking ``(coordinator, vehicle_id)``
+    """
+
+    def __init__(self: OVMSEntity, coordinator: Any, vehicle_id: str) -> None:
+        self._section = getattr(coordinator, bucket)
+        OVMSEntity.__init__(self, coordinator, vehicle_id)
+
+    def value(self: OVMSEntity) -> Any:
+        return self._section.get(key)
+
+    def read_value(self: OVMSEntity) -> Any:
+        return self._section.get(key, _ABSENT)
+
+    def available(self: OVMSEntity) -> bool:
+        # Unavailable while the section has no data (not fetched yet, or
+        # cleared after failed fetches), without reading the value
+        return self.coordinator.last_update_success and key in self._section
+
+    attrs.update(
+        __doc__=doc,
+        __module__=__name__,
+        __qualname__=class_name,
+        _entity_key=config.unique_id,
+        _attr_name=config.name,
+        _attr_icon=config.icon,
+        __init__=__init__,
+        _read_value=read_value,
+    )
+    attrs[value_property] = property(value)
+    attrs["available"] = property(available)
+    return type(class_name, (OVMSEntity, base), attrs)
+
+
+def _bucket_key_sensor(
+    class_name: str,
+    doc: str,
+    bucket: str,
+    key: str,
+    config: EntityConfig,
+    **attrs: Any,
+) -> type[SensorEntity]:
+    """Create a sensor class reporting a single coordinator value.
+
+    Args:
+        class_name: Name of the generated class
+        doc: Docstring of the generated class
+        bucket: Coordinator data section holding the value
+        key: Key of the value within the section
+        config: Entity configuration of the generated class
+        **attrs: Additional class attributes such as ``_attr_*`` defaults
+
+    Returns:
+        Sensor entity class taking ``(coordinator, vehicle_id)``
+    """
+    return _bucket_key_entity(
+        SensorEntity, "native_value", class_name, doc, bucket, key, config, attrs
+    )
+
+
+def _bucket_key_binary_sensor(
+    class_name: str,
+    doc: str,
+    bucket: str,
+    key: str,
+    config: EntityConfig,
+    **attrs: Any,
+) -> type[BinarySensorEntity]:
+    """Create a binary sensor class reporting a single coordinator flag.
+
+    Args:
+        class_name: Name of the generated class
+        doc: Docstring of the generated class
+        bucket: Coordinator data section holding the flag
+        key: Key of the flag within the section
+        config: Entity configuration of the generated class
+        **attrs: Additional class attributes such as ``_attr_*`` defaults
+
+    Returns:
+        Binary sensor entity class taking ``(coordinator, vehicle_id)``
+    """
+    return _bucket_key_entity(
+        BinarySensorEntity, "is_on", class_name, doc, bucket, key, config, attrs
+    )
+
+
 class ACOnButton(OVMSEntity, ButtonEntity):
     """Button entity to turn on the vehicle AC.
 
@@ -137,23 +362,9 @@ class ACOnButton(OVMSEntity, ButtonEntity):
     Some vehicles (e.g., Seres SQ) use different command codes.
     """
 
-    def __init__(
-        self,
-        coordinator: Any,
-        vehicle_id: str,
-    ) -> None:
-        """Initialize AC ON button.
-
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="ac_on",
-            name="AC On",
-            icon="mdi:air-conditioner",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+    _entity_key = "ac_on"
+    _attr_name = "AC On"
+    _attr_icon = "mdi:air-conditioner"
 
     async def async_press(self) -> None:
         """Handle button press - send AC ON command to vehicle."""
@@ -171,614 +382,437 @@ class ACOnButton(OVMSEntity, ButtonEntity):
             _LOGGER.debug("Sending AC ON command (26,1)")
             result = await self.coordinator.async_send_command("26,1")
             if result:
+                # The coordinator already requested a refresh
                 _LOGGER.info("AC ON command sent successfully")
-                await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.error("Failed to send AC ON command")
         except (ValueError, KeyError, RuntimeError) as err:
             _LOGGER.error("Failed to turn on AC: %s", err)
 
 
-class AmbientTemperatureSensor(OVMSEntity, SensorEntity):
-    """Sensor for ambient (outside) temperature."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize ambient temperature sensor."""
-        config = EntityConfig(
-            unique_id="temp_ambient",
-            name="Ambient Temperature",
-            icon="mdi:thermometer",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return ambient temperature."""
-        return self.coordinator.data.get("status", {}).get("temperature_ambient")
-
-
-class CabinTemperatureSensor(OVMSEntity, SensorEntity):
-    """Sensor for cabin (interior) temperature."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize cabin temperature sensor."""
-        config = EntityConfig(
-            unique_id="temp_cabin",
-            name="Cabin Temperature",
-            icon="mdi:thermometer",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return cabin temperature."""
-        return self.coordinator.data.get("status", {}).get("temperature_cabin")
+AmbientTemperatureSensor = _bucket_key_sensor(
+    "AmbientTemperatureSensor",
+    "Sensor for ambient (outside) temperature.",
+    "status",
+    "temperature_ambient",
+    EntityConfig(
+        unique_id="temp_ambient",
+        name="Ambient Temperature",
+        icon="mdi:thermometer",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+)
 
 
-class BatteryTemperatureSensor(OVMSEntity, SensorEntity):
-    """Sensor for battery temperature."""
+CabinTemperatureSensor = _bucket_key_sensor(
+    "CabinTemperatureSensor",
+    "Sensor for cabin (interior) temperature.",
+    "status",
+    "temperature_cabin",
+    EntityConfig(
+        unique_id="temp_cabin",
+        name="Cabin Temperature",
+        icon="mdi:thermometer",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+)
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize battery temperature sensor."""
-        config = EntityConfig(
-            unique_id="temp_battery",
-            name="Battery Temperature",
-            icon="mdi:thermometer",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return battery temperature."""
-        return self.coordinator.data.get("status", {}).get("temperature_battery")
+BatteryTemperatureSensor = _bucket_key_sensor(
+    "BatteryTemperatureSensor",
+    "Sensor for battery temperature.",
+    "status",
+    "temperature_battery",
+    EntityConfig(
+        unique_id="temp_battery",
+        name="Battery Temperature",
+        icon="mdi:thermometer",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+)
 
 
 class StateOfChargeSensor(OVMSEntity, SensorEntity):
     """Sensor for state of charge (battery %)."""
 
+    _entity_key = "soc"
+    _attr_name = "State of Charge"
+    _attr_icon = "mdi:battery"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize SOC sensor."""
-        config = EntityConfig(
-            unique_id="soc",
-            name="State of Charge",
-            icon="mdi:battery",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-        self._soc_source = "status.soc"
+    def _update_from_data(self) -> None:
+        """Update state of charge and diagnostic attributes."""
+        status = self.coordinator.status
+        charge = self.coordinator.charge
+        status_soc = status.get("soc")
+        charge_soc = charge.get("soc")
 
-    @property
-    def native_value(self) -> int | None:
-        """Return state of charge percentage."""
         # Try multiple SOC sources with fallback logic
         # Primary: status.soc
-        soc = self.coordinator.data.get("status", {}).get("soc")
+        soc = status_soc
         soc_source = "status.soc"
 
         # Fallback 1: charge.soc (some OVMS configs report SOC here)
-        if soc is None or soc == 0:
-            charge_soc = self.coordinator.data.get("charge", {}).get("soc")
-            if charge_soc not in (None, 0):
-                soc = charge_soc
-                soc_source = "charge.soc"
-
-        # Store source for diagnostic purposes
-        self._soc_source = soc_source
+        if (soc is None or soc == 0) and charge_soc not in (None, 0):
+            soc = charge_soc
+            soc_source = "charge.soc"
 
         # Return None instead of 0 if truly unavailable
-        return soc if soc not in (None, 0) else None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
-        attrs = {}
-
-        # Show which field provided the SOC value
-        if hasattr(self, "_soc_source"):
-            attrs["source"] = self._soc_source
-
-        # Show raw values for debugging
-        status_soc = self.coordinator.data.get("status", {}).get("soc")
-        charge_soc = self.coordinator.data.get("charge", {}).get("soc")
-
-        attrs["status_soc_raw"] = status_soc
-        attrs["charge_soc_raw"] = charge_soc
+        self._attr_native_value = soc if soc not in (None, 0) else None
+
+        attrs = {
+            # Show which field provided the SOC value
+            "source": soc_source,
+            # Show raw values for debugging
+            "status_soc_raw": status_soc,
+            "charge_soc_raw": charge_soc,
+        }
 
         # Show SOH if available (helps diagnose battery issues)
-        soh = self.coordinator.data.get("status", {}).get("soh")
+        soh = status.get("soh")
         if soh is not None:
             attrs["battery_health"] = soh
 
-        return attrs
-
-
-class RangeSensor(OVMSEntity, SensorEntity):
-    """Sensor for estimated driving range."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize range sensor."""
-        config = EntityConfig(
-            unique_id="range",
-            name="Estimated Range",
-            icon="mdi:map-marker-distance",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return estimated range."""
-        return self.coordinator.data.get("status", {}).get("estimatedrange")
-
-
-class OdometerSensor(OVMSEntity, SensorEntity):
-    """Sensor for vehicle odometer reading."""
-
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize odometer sensor."""
-        config = EntityConfig(
-            unique_id="odometer",
-            name="Odometer",
-            icon="mdi:speedometer",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return odometer reading."""
-        return self.coordinator.data.get("status", {}).get("odometer")
-
-
-class SpeedSensor(OVMSEntity, SensorEntity):
-    """Sensor for current vehicle speed."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfSpeed.KILOMETERS_PER_HOUR
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize speed sensor."""
-        config = EntityConfig(
-            unique_id="speed",
-            name="Speed",
-            icon="mdi:speedometer",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return current speed."""
-        return self.coordinator.data.get("status", {}).get("speed")
-
-
-class ChargingPowerSensor(OVMSEntity, SensorEntity):
-    """Sensor for current charging power."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charging power sensor."""
-        config = EntityConfig(
-            unique_id="charge_power",
-            name="Charging Power",
-            icon="mdi:flash",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return charging power."""
-        return self.coordinator.data.get("charge", {}).get("chargepower")
-
-
-class ChargingCurrentSensor(OVMSEntity, SensorEntity):
-    """Sensor for charging current."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "A"
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charging current sensor."""
-        config = EntityConfig(
-            unique_id="charge_current",
-            name="Charging Current",
-            icon="mdi:current-ac",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return charging current."""
-        return self.coordinator.data.get("charge", {}).get("chargecurrent")
-
-
-class ChargingStateSensor(OVMSEntity, SensorEntity):
-    """Sensor for charging state."""
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charging state sensor."""
-        config = EntityConfig(
-            unique_id="charge_state",
-            name="Charging State",
-            icon="mdi:battery-charging",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> str | None:
-        """Return charging state."""
-        return self.coordinator.data.get("charge", {}).get("chargestate")
-
-
-class TimeToFullSensor(OVMSEntity, SensorEntity):
-    """Sensor for estimated time to full charge."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize time to full sensor."""
-        config = EntityConfig(
-            unique_id="charge_etr_full",
-            name="Time to Full",
-            icon="mdi:timer",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return estimated time to full charge."""
-        return self.coordinator.data.get("charge", {}).get("charge_etr_full")
-
-
-class StateOfHealthSensor(OVMSEntity, SensorEntity):
-    """Sensor for battery state of health."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = PERCENTAGE
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize state of health sensor."""
-        config = EntityConfig(
-            unique_id="soh",
-            name="State of Health",
-            icon="mdi:battery-heart",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return battery state of health percentage."""
-        return self.coordinator.data.get("status", {}).get("soh")
-
-
-class Battery12VSensor(OVMSEntity, SensorEntity):
-    """Sensor for 12V auxiliary battery voltage."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "V"
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize 12V battery sensor."""
-        config = EntityConfig(
-            unique_id="vehicle12v",
-            name="12V Battery",
-            icon="mdi:car-battery",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return 12V battery voltage."""
-        return self.coordinator.data.get("status", {}).get("vehicle12v")
-
-
-class Battery12VCurrentSensor(OVMSEntity, SensorEntity):
-    """Sensor for 12V auxiliary battery current."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "A"
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize 12V battery current sensor."""
-        config = EntityConfig(
-            unique_id="vehicle12v_current",
-            name="12V Battery Current",
-            icon="mdi:current-dc",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return 12V battery current."""
-        return self.coordinator.data.get("status", {}).get("vehicle12v_current")
+        self._attr_extra_state_attributes = attrs
+
+
+RangeSensor = _bucket_key_sensor(
+    "RangeSensor",
+    "Sensor for estimated driving range.",
+    "status",
+    "estimatedrange",
+    EntityConfig(
+        unique_id="range",
+        name="Estimated Range",
+        icon="mdi:map-marker-distance",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfLength.KILOMETERS,
+)
 
 
-class LatitudeSensor(OVMSEntity, SensorEntity):
-    """Sensor for GPS latitude."""
+OdometerSensor = _bucket_key_sensor(
+    "OdometerSensor",
+    "Sensor for vehicle odometer reading.",
+    "status",
+    "odometer",
+    EntityConfig(
+        unique_id="odometer",
+        name="Odometer",
+        icon="mdi:speedometer",
+    ),
+    _attr_state_class=SensorStateClass.TOTAL_INCREASING,
+    _attr_native_unit_of_measurement=UnitOfLength.KILOMETERS,
+)
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize latitude sensor."""
-        config = EntityConfig(
-            unique_id="latitude",
-            name="Latitude",
-            icon="mdi:crosshairs-gps",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+SpeedSensor = _bucket_key_sensor(
+    "SpeedSensor",
+    "Sensor for current vehicle speed.",
+    "status",
+    "speed",
+    EntityConfig(
+        unique_id="speed",
+        name="Speed",
+        icon="mdi:speedometer",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return latitude."""
-        return self.coordinator.data.get("location", {}).get("latitude")
 
+ChargingPowerSensor = _bucket_key_sensor(
+    "ChargingPowerSensor",
+    "Sensor for current charging power.",
+    "charge",
+    "chargepower",
+    EntityConfig(
+        unique_id="charge_power",
+        name="Charging Power",
+        icon="mdi:flash",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfPower.WATT,
+)
 
-class LongitudeSensor(OVMSEntity, SensorEntity):
-    """Sensor for GPS longitude."""
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
+ChargingCurrentSensor = _bucket_key_sensor(
+    "ChargingCurrentSensor",
+    "Sensor for charging current.",
+    "charge",
+    "chargecurrent",
+    EntityConfig(
+        unique_id="charge_current",
+        name="Charging Current",
+        icon="mdi:current-ac",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement="A",
+)
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize longitude sensor."""
-        config = EntityConfig(
-            unique_id="longitude",
-            name="Longitude",
-            icon="mdi:crosshairs-gps",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return longitude."""
-        return self.coordinator.data.get("location", {}).get("longitude")
+ChargingStateSensor = _bucket_key_sensor(
+    "ChargingStateSensor",
+    "Sensor for charging state.",
+    "charge",
+    "chargestate",
+    EntityConfig(
+        unique_id="charge_state",
+        name="Charging State",
+        icon="mdi:battery-charging",
+    ),
+)
 
 
-class AltitudeSensor(OVMSEntity, SensorEntity):
-    """Sensor for GPS altitude."""
+TimeToFullSensor = _bucket_key_sensor(
+    "TimeToFullSensor",
+    "Sensor for estimated time to full charge.",
+    "charge",
+    "charge_etr_full",
+    EntityConfig(
+        unique_id="charge_etr_full",
+        name="Time to Full",
+        icon="mdi:timer",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfTime.MINUTES,
+)
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "m"
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize altitude sensor."""
-        config = EntityConfig(
-            unique_id="altitude",
-            name="Altitude",
-            icon="mdi:image-filter-hdr",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> int | None:
-        """Return altitude in meters."""
-        return self.coordinator.data.get("location", {}).get("altitude")
+StateOfHealthSensor = _bucket_key_sensor(
+    "StateOfHealthSensor",
+    "Sensor for battery state of health.",
+    "status",
+    "soh",
+    EntityConfig(
+        unique_id="soh",
+        name="State of Health",
+        icon="mdi:battery-heart",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=PERCENTAGE,
+)
 
 
-class DirectionSensor(OVMSEntity, SensorEntity):
-    """Sensor for vehicle direction/heading."""
+Battery12VSensor = _bucket_key_sensor(
+    "Battery12VSensor",
+    "Sensor for 12V auxiliary battery voltage.",
+    "status",
+    "vehicle12v",
+    EntityConfig(
+        unique_id="vehicle12v",
+        name="12V Battery",
+        icon="mdi:car-battery",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement="V",
+)
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "°"
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize direction sensor."""
-        config = EntityConfig(
-            unique_id="direction",
-            name="Direction",
-            icon="mdi:compass",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> int | None:
-        """Return direction in degrees."""
-        return self.coordinator.data.get("location", {}).get("direction")
+Battery12VCurrentSensor = _bucket_key_sensor(
+    "Battery12VCurrentSensor",
+    "Sensor for 12V auxiliary battery current.",
+    "status",
+    "vehicle12v_current",
+    EntityConfig(
+        unique_id="vehicle12v_current",
+        name="12V Battery Current",
+        icon="mdi:current-dc",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement="A",
+)
 
 
-class BatteryVoltageSensor(OVMSEntity, SensorEntity):
-    """Sensor for main battery pack voltage."""
+LatitudeSensor = _bucket_key_sensor(
+    "LatitudeSensor",
+    "Sensor for GPS latitude.",
+    "location",
+    "latitude",
+    EntityConfig(
+        unique_id="latitude",
+        name="Latitude",
+        icon="mdi:crosshairs-gps",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+)
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "V"
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize battery voltage sensor."""
-        config = EntityConfig(
-            unique_id="battvoltage",
-            name="Battery Voltage",
-            icon="mdi:lightning-bolt",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> int | None:
-        """Return battery pack voltage."""
-        return self.coordinator.data.get("charge", {}).get("battvoltage")
+LongitudeSensor = _bucket_key_sensor(
+    "LongitudeSensor",
+    "Sensor for GPS longitude.",
+    "location",
+    "longitude",
+    EntityConfig(
+        unique_id="longitude",
+        name="Longitude",
+        icon="mdi:crosshairs-gps",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+)
 
 
-class EnergyUsedSensor(OVMSEntity, SensorEntity):
-    """Sensor for energy used."""
+AltitudeSensor = _bucket_key_sensor(
+    "AltitudeSensor",
+    "Sensor for GPS altitude.",
+    "location",
+    "altitude",
+    EntityConfig(
+        unique_id="altitude",
+        name="Altitude",
+        icon="mdi:image-filter-hdr",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement="m",
+)
 
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = "kWh"
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize energy used sensor."""
-        config = EntityConfig(
-            unique_id="energyused",
-            name="Energy Used",
-            icon="mdi:lightning-bolt",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+DirectionSensor = _bucket_key_sensor(
+    "DirectionSensor",
+    "Sensor for vehicle direction/heading.",
+    "location",
+    "direction",
+    EntityConfig(
+        unique_id="direction",
+        name="Direction",
+        icon="mdi:compass",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement="°",
+)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return energy used."""
-        return self.coordinator.data.get("location", {}).get("energyused")
 
+BatteryVoltageSensor = _bucket_key_sensor(
+    "BatteryVoltageSensor",
+    "Sensor for main battery pack voltage.",
+    "charge",
+    "battvoltage",
+    EntityConfig(
+        unique_id="battvoltage",
+        name="Battery Voltage",
+        icon="mdi:lightning-bolt",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement="V",
+)
 
-class EnergyRecoveredSensor(OVMSEntity, SensorEntity):
-    """Sensor for energy recovered through regeneration."""
 
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = "kWh"
+EnergyUsedSensor = _bucket_key_sensor(
+    "EnergyUsedSensor",
+    "Sensor for energy used.",
+    "location",
+    "energyused",
+    EntityConfig(
+        unique_id="energyused",
+        name="Energy Used",
+        icon="mdi:lightning-bolt",
+    ),
+    _attr_state_class=SensorStateClass.TOTAL_INCREASING,
+    _attr_native_unit_of_measurement="kWh",
+)
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize energy recovered sensor."""
-        config = EntityConfig(
-            unique_id="energyrecd",
-            name="Energy Recovered",
-            icon="mdi:recycle",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return energy recovered."""
-        return self.coordinator.data.get("location", {}).get("energyrecd")
+EnergyRecoveredSensor = _bucket_key_sensor(
+    "EnergyRecoveredSensor",
+    "Sensor for energy recovered through regeneration.",
+    "location",
+    "energyrecd",
+    EntityConfig(
+        unique_id="energyrecd",
+        name="Energy Recovered",
+        icon="mdi:recycle",
+    ),
+    _attr_state_class=SensorStateClass.TOTAL_INCREASING,
+    _attr_native_unit_of_measurement="kWh",
+)
 
 
 class LastSeenSensor(OVMSEntity, SensorEntity):
     """Sensor for when OVMS unit last communicated with server."""
 
+    _entity_key = "last_seen"
+    _attr_name = "Last Seen"
+    _attr_icon = "mdi:clock-outline"
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize last seen sensor."""
-        config = EntityConfig(
-            unique_id="last_seen",
-            name="Last Seen",
-            icon="mdi:clock-outline",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> datetime | None:
-        """Return last seen timestamp."""
+    def _update_from_data(self) -> None:
+        """Update last seen timestamp and message age."""
+        status = self.coordinator.status
+        charge = self.coordinator.charge
+        location = self.coordinator.location
         # Try status message time first, fall back to other message times
         timestamp_str = (
-            self.coordinator.data.get("status", {}).get("m_msgtime_s")
-            or self.coordinator.data.get("charge", {}).get("m_msgtime_s")
-            or self.coordinator.data.get("location", {}).get("m_msgtime_l")
+            status.get("m_msgtime_s")
+            or charge.get("m_msgtime_s")
+            or location.get("m_msgtime_l")
+        )
+        self._attr_native_value = (
+            _parse_timestamp(timestamp_str) if timestamp_str else None
         )
 
-        if timestamp_str:
-            try:
-                # Parse ISO format timestamp and make it UTC aware
-                dt = datetime.fromisoformat(timestamp_str.replace(" ", "T"))
-                # If timezone-naive, assume UTC
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=UTC)
-            except (ValueError, AttributeError):
-                return None
-            else:
-                return dt
-
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
         attrs = {}
 
         # Add age in seconds if available
-        age = self.coordinator.data.get("status", {}).get("m_msgage_s")
+        age = status.get("m_msgage_s")
         if age is not None:
             attrs["age_seconds"] = age
 
-        return attrs
-
-
-class GSMSignalSensor(OVMSEntity, SensorEntity):
-    """Sensor for GSM signal strength."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "dBm"
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize GSM signal sensor."""
-        config = EntityConfig(
-            unique_id="gsm_signal",
-            name="GSM Signal",
-            icon="mdi:signal-cellular-3",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return GSM signal strength."""
-        return self.coordinator.data.get("status", {}).get("car_gsm_signal")
-
-
-class WiFiSignalSensor(OVMSEntity, SensorEntity):
-    """Sensor for WiFi signal strength.
-
-    Note: WiFi signal quality is not available via OVMS Protocol v2.
-    This sensor is disabled by default.
-    """
+        self._attr_extra_state_attributes = attrs
+
+
+GSMSignalSensor = _bucket_key_sensor(
+    "GSMSignalSensor",
+    "Sensor for GSM signal strength.",
+    "status",
+    "car_gsm_signal",
+    EntityConfig(
+        unique_id="gsm_signal",
+        name="GSM Signal",
+        icon="mdi:signal-cellular-3",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement="dBm",
+)
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "dBm"
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize WiFi signal sensor."""
-        config = EntityConfig(
-            unique_id="wifi_signal",
-            name="WiFi Signal",
-            icon="mdi:wifi",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> int | None:
-        """Return WiFi signal strength."""
-        return self.coordinator.data.get("status", {}).get("car_wifi_signal")
+# Note: WiFi signal quality is not available via OVMS Protocol v2.
+# This sensor is disabled by default.
+WiFiSignalSensor = _bucket_key_sensor(
+    "WiFiSignalSensor",
+    "Sensor for WiFi signal strength.",
+    "status",
+    "car_wifi_signal",
+    EntityConfig(
+        unique_id="wifi_signal",
+        name="WiFi Signal",
+        icon="mdi:wifi",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement="dBm",
+    _attr_entity_registry_enabled_default=False,
+)
 
 
 class ConnectionStatusSensor(OVMSEntity, SensorEntity):
     """Binary sensor for vehicle server connection status."""
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize connection status sensor."""
-        config = EntityConfig(
-            unique_id="connection_status",
-            name="Connection Status",
-            icon="mdi:lan-connect",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+    _entity_key = "connection_status"
+    _attr_name = "Connection Status"
+    _attr_icon = "mdi:lan-connect"
 
-    @property
-    def native_value(self) -> str:
-        """Return connection status."""
-        v_net_connected = self.coordinator.data.get("vehicle", {}).get(
-            "v_net_connected", 0
+    def _update_from_data(self) -> None:
+        """Update connection status and connection counts."""
+        vehicle_data = self.coordinator.vehicle
+        v_net_connected = vehicle_data.get("v_net_connected", 0)
+        self._attr_native_value = (
+            "connected" if v_net_connected > 0 else "disconnected"
         )
-        return "connected" if v_net_connected > 0 else "disconnected"
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
-        vehicle_data = self.coordinator.data.get("vehicle", {})
-        return {
-            "car_connections": vehicle_data.get("v_net_connected", 0),
+        self._attr_extra_state_attributes = {
+            "car_connections": v_net_connected,
             "app_connections": vehicle_data.get("v_apps_connected", 0),
             "batch_connections": vehicle_data.get("v_btcs_connected", 0),
         }
@@ -787,24 +821,20 @@ class ConnectionStatusSensor(OVMSEntity, SensorEntity):
 class DoorLockEntity(OVMSEntity, LockEntity):
     """Lock entity for vehicle door locks."""
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize lock entity.
+    _entity_key = "lock"
+    _attr_name = "Door Lock"
+    _attr_icon = "mdi:lock"
 
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="lock",
-            name="Door Lock",
-            icon="mdi:lock",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+    # Command code and log wording by target lock state
+    _COMMANDS: dict[bool, tuple[str, str]] = {
+        True: ("20", "lock"),
+        False: ("22", "unlock"),
+    }
 
     @property
     def is_locked(self) -> bool | None:
         """Return lock state."""
-        return self.coordinator.data.get("status", {}).get("carlocked")
+        return self.coordinator.status.get("carlocked")
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the vehicle.
@@ -812,15 +842,7 @@ class DoorLockEntity(OVMSEntity, LockEntity):
         Args:
             **kwargs: Additional arguments
         """
-        if not self.coordinator.ovms_client:
-            _LOGGER.error("OVMS Protocol client not available, cannot lock vehicle")
-            return
-
-        try:
-            await self.coordinator.ovms_client.send_command("20")
-            await self.coordinator.async_request_refresh()
-        except (ValueError, KeyError, RuntimeError) as err:
-            _LOGGER.error("Failed to lock vehicle: %s", err)
+        await self._async_set_locked(True)
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the vehicle.
@@ -828,38 +850,38 @@ class DoorLockEntity(OVMSEntity, LockEntity):
         Args:
             **kwargs: Additional arguments
         """
+        await self._async_set_locked(False)
+
+    async def _async_set_locked(self, locked: bool) -> None:
+        """Send the lock or unlock command.
+
+        Args:
+            locked: True to lock, False to unlock
+        """
+        command, action = self._COMMANDS[locked]
         if not self.coordinator.ovms_client:
-            _LOGGER.error("OVMS Protocol client not available, cannot unlock vehicle")
+            _LOGGER.error(
+                "OVMS Protocol client not available, cannot %s vehicle", action
+            )
             return
 
         try:
-            await self.coordinator.ovms_client.send_command("22")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command(command)
         except (ValueError, KeyError, RuntimeError) as err:
-            _LOGGER.error("Failed to unlock vehicle: %s", err)
+            _LOGGER.error("Failed to %s vehicle: %s", action, err)
 
 
 class CooldownSwitch(OVMSEntity, SwitchEntity):
     """Switch for battery/cabin cooldown."""
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize cooldown switch.
-
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="cooldown",
-            name="Cooldown",
-            icon="mdi:water-percent",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+    _entity_key = "cooldown"
+    _attr_name = "Cooldown"
+    _attr_icon = "mdi:water-percent"
 
     @property
     def is_on(self) -> bool | None:
         """Return cooldown state."""
-        return self.coordinator.data.get("charge", {}).get("cooldown_active", False)
+        return self.coordinator.charge.get("cooldown_active", False)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Activate cooldown.
@@ -874,8 +896,7 @@ class CooldownSwitch(OVMSEntity, SwitchEntity):
             return
 
         try:
-            await self.coordinator.ovms_client.send_command("25")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command("25")
         except (ValueError, KeyError, RuntimeError) as err:
             _LOGGER.error("Failed to activate cooldown: %s", err)
 
@@ -892,24 +913,20 @@ class CooldownSwitch(OVMSEntity, SwitchEntity):
 class ValetModeSwitch(OVMSEntity, SwitchEntity):
     """Switch for valet mode."""
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize valet mode switch.
+    _entity_key = "valet_mode"
+    _attr_name = "Valet Mode"
+    _attr_icon = "mdi:car-key"
 
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="valet_mode",
-            name="Valet Mode",
-            icon="mdi:car-key",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+    # Command code and log wording by target valet mode state
+    _COMMANDS: dict[bool, tuple[str, str]] = {
+        True: ("21", "enable"),
+        False: ("23", "disable"),
+    }
 
     @property
     def is_on(self) -> bool | None:
         """Return valet mode state."""
-        return self.coordinator.data.get("status", {}).get("valetmode", False)
+        return self.coordinator.status.get("valetmode", False)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable valet mode.
@@ -917,17 +934,7 @@ class ValetModeSwitch(OVMSEntity, SwitchEntity):
         Args:
             **kwargs: Additional arguments
         """
-        if not self.coordinator.ovms_client:
-            _LOGGER.error(
-                "OVMS Protocol client not available, cannot enable valet mode"
-            )
-            return
-
-        try:
-            await self.coordinator.ovms_client.send_command("21")
-            await self.coordinator.async_request_refresh()
-        except (ValueError, KeyError, RuntimeError) as err:
-            _LOGGER.error("Failed to enable valet mode: %s", err)
+        await self._async_set_valet_mode(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable valet mode.
@@ -935,45 +942,41 @@ class ValetModeSwitch(OVMSEntity, SwitchEntity):
         Args:
             **kwargs: Additional arguments
         """
+        await self._async_set_valet_mode(False)
+
+    async def _async_set_valet_mode(self, enabled: bool) -> None:
+        """Send the valet mode on or off command.
+
+        Args:
+            enabled: True to enable valet mode, False to disable it
+        """
+        command, action = self._COMMANDS[enabled]
         if not self.coordinator.ovms_client:
             _LOGGER.error(
-                "OVMS Protocol client not available, cannot disable valet mode"
+                "OVMS Protocol client not available, cannot %s valet mode", action
             )
             return
 
         try:
-            await self.coordinator.ovms_client.send_command("23")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command(command)
         except (ValueError, KeyError, RuntimeError) as err:
-            _LOGGER.error("Failed to disable valet mode: %s", err)
+            _LOGGER.error("Failed to %s valet mode: %s", action, err)
 
 
 class ChargeLimitNumber(OVMSEntity, NumberEntity):
     """Number entity for setting charge limit SOC."""
 
+    _entity_key = "charge_limit"
+    _attr_name = "Charge Limit"
+    _attr_icon = "mdi:battery-charging-100"
     _attr_native_min_value = 50
     _attr_native_max_value = 100
     _attr_native_step = 1
     _attr_native_unit_of_measurement = PERCENTAGE
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charge limit number entity.
-
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="charge_limit",
-            name="Charge Limit",
-            icon="mdi:battery-charging-100",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return current charge limit."""
-        return self.coordinator.data.get("charge", {}).get("chargelimit")
+    def _update_from_data(self) -> None:
+        """Show the charge limit reported by the vehicle."""
+        self._attr_native_value = self.coordinator.charge.get("chargelimit")
 
     async def async_set_native_value(self, value: float) -> None:
         """Set charge limit SOC.
@@ -987,8 +990,10 @@ class ChargeLimitNumber(OVMSEntity, NumberEntity):
 
         try:
             soc_int = int(value)
-            await self.coordinator.ovms_client.send_command(f"16,{soc_int}")
-            await self.coordinator.async_request_refresh()
+            if await self.coordinator.async_send_command(f"16,{soc_int}"):
+                # Show the new limit until the next coordinator update
+                self._attr_native_value = soc_int
+                self.async_write_ha_state()
         except (ValueError, KeyError, RuntimeError) as err:
             _LOGGER.error("Failed to set charge limit: %s", err)
 
@@ -996,29 +1001,17 @@ class ChargeLimitNumber(OVMSEntity, NumberEntity):
 class ChargingCurrentNumber(OVMSEntity, NumberEntity):
     """Number entity for setting charging current."""
 
+    _entity_key = "charge_current"
+    _attr_name = "Charge Current"
+    _attr_icon = "mdi:current-ac"
     _attr_native_min_value = 0
     _attr_native_max_value = 100
     _attr_native_step = 1
     _attr_native_unit_of_measurement = "A"
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charging current number entity.
-
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="charge_current",
-            name="Charge Current",
-            icon="mdi:current-ac",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return current charging current setting."""
-        return self.coordinator.data.get("charge", {}).get("chargecurrent")
+    def _update_from_data(self) -> None:
+        """Show the charging current reported by the vehicle."""
+        self._attr_native_value = self.coordinator.charge.get("chargecurrent")
 
     async def async_set_native_value(self, value: float) -> None:
         """Set charging current.
@@ -1034,8 +1027,10 @@ class ChargingCurrentNumber(OVMSEntity, NumberEntity):
 
         try:
             amps_int = int(value)
-            await self.coordinator.ovms_client.send_command(f"15,{amps_int}")
-            await self.coordinator.async_request_refresh()
+            if await self.coordinator.async_send_command(f"15,{amps_int}"):
+                # Show the new current until the next coordinator update
+                self._attr_native_value = amps_int
+                self.async_write_ha_state()
         except (ValueError, KeyError, RuntimeError) as err:
             _LOGGER.error("Failed to set charging current: %s", err)
 
@@ -1043,37 +1038,14 @@ class ChargingCurrentNumber(OVMSEntity, NumberEntity):
 class GPSStreamingIntervalNumber(OVMSEntity, NumberEntity):
     """Number entity for setting GPS streaming interval (feature #8)."""
 
+    _entity_key = "gps_streaming_interval"
+    _attr_name = "GPS Streaming Interval"
+    _attr_icon = "mdi:map-marker-radius"
     _attr_native_min_value = 0
     _attr_native_max_value = 3600
     _attr_native_step = 10
     _attr_native_unit_of_measurement = "s"
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize GPS streaming interval number entity.
-
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="gps_streaming_interval",
-            name="GPS Streaming Interval",
-            icon="mdi:map-marker-radius",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return current GPS streaming interval from feature #8."""
-        features = self.coordinator.data.get("features", {})
-        value = features.get(8)
-        if value is not None:
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return None
-        return None
-
     async def async_set_native_value(self, value: float) -> None:
         """Set GPS streaming interval using command 2.
 
@@ -1087,11 +1059,11 @@ class GPSStreamingIntervalNumber(OVMSEntity, NumberEntity):
         try:
             interval_int = int(value)
             # Command 2 format: "2,<feature_slot>,<value>"
-            await self.coordinator.ovms_client.send_command(f"2,8,{interval_int}")
-            # Update local cache
-            features = self.coordinator.data.get("features", {})
-            features[8] = str(interval_int)
-            await self.coordinator.async_request_refresh()
+            if await self.coordinator.async_send_command(f"2,8,{interval_int}"):
+                # Feature values are not polled, so the last value set from
+                # Home Assistant is what the entity shows
+                self._attr_native_value = interval_int
+                self.async_write_ha_state()
         except (ValueError, KeyError, RuntimeError) as err:
             _LOGGER.error("Failed to set GPS streaming interval: %s", err)
 
@@ -1099,42 +1071,22 @@ class GPSStreamingIntervalNumber(OVMSEntity, NumberEntity):
 class RefreshButton(OVMSEntity, ButtonEntity):
     """Button entity to manually refresh vehicle data."""
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize refresh button.
-
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="refresh",
-            name="Refresh Data",
-            icon="mdi:refresh",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+    _entity_key = "refresh"
+    _attr_name = "Refresh Data"
+    _attr_icon = "mdi:refresh"
 
     async def async_press(self) -> None:
         """Handle button press - refresh vehicle data immediately."""
         _LOGGER.info("Manual refresh requested for vehicle %s", self.vehicle_id)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_request_fresh_refresh()
 
 
 class WakeUpButton(OVMSEntity, ButtonEntity):
     """Button entity to wake up the vehicle."""
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize wake-up button.
-
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="wakeup",
-            name="Wake Up",
-            icon="mdi:sleep",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+    _entity_key = "wakeup"
+    _attr_name = "Wake Up"
+    _attr_icon = "mdi:sleep"
 
     async def async_press(self) -> None:
         """Handle button press - send wake-up command to vehicle."""
@@ -1142,19 +1094,33 @@ class WakeUpButton(OVMSEntity, ButtonEntity):
             _LOGGER.error("OVMS Protocol client not available, cannot wake up vehicle")
             return
 
+        _LOGGER.info("Sending wake-up command to vehicle %s", self.vehicle_id)
         try:
-            _LOGGER.info("Sending wake-up command to vehicle %s", self.vehicle_id)
-            await self.coordinator.ovms_client.send_command("18")
-            # Wait a moment for the vehicle to wake up before refreshing
-            await asyncio.sleep(2)
-            await self.coordinator.async_request_refresh()
-        except (ValueError, KeyError, RuntimeError) as err:
+            sent = await self.coordinator.async_send_command("18", refresh=False)
+        except OVMSConnectionError as err:
             _LOGGER.error("Failed to wake up vehicle: %s", err)
+            return
+        if not sent:
+            _LOGGER.error("Failed to wake up vehicle %s", self.vehicle_id)
+            return
+
+        # Poll every few seconds while the vehicle comes online; the refresh
+        # reschedules the next poll on the shorter interval
+        self.coordinator.boost_update_interval()
+        await self.coordinator.async_request_refresh()
 
 
 class HomeLinkButton(OVMSEntity, ButtonEntity):
     """Button entity to activate HomeLink."""
 
+    _attr_icon = "mdi:garage"
+
+    # Configuration per HomeLink button number, shared across vehicles
+    _CONFIGS = tuple(
+        EntityConfig(unique_id=f"homelink_{number + 1}", name=f"HomeLink {number + 1}")
+        for number in range(3)
+    )
+
     def __init__(self, coordinator: Any, vehicle_id: str, button_number: int) -> None:
         """Initialize HomeLink button.
 
@@ -1164,12 +1130,8 @@ class HomeLinkButton(OVMSEntity, ButtonEntity):
             button_number: HomeLink button number (0, 1, or 2)
         """
         self.button_number = button_number
-        config = EntityConfig(
-            unique_id=f"homelink_{button_number + 1}",
-            name=f"HomeLink {button_number + 1}",
-            icon="mdi:garage",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+        self._command = f"24,{button_number}"
+        super().__init__(coordinator, vehicle_id, self._CONFIGS[button_number])
 
     async def async_press(self) -> None:
         """Handle button press - activate HomeLink."""
@@ -1185,8 +1147,7 @@ class HomeLinkButton(OVMSEntity, ButtonEntity):
                 self.button_number + 1,
                 self.vehicle_id,
             )
-            await self.coordinator.ovms_client.send_command(f"24,{self.button_number}")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command(self._command)
         except (ValueError, KeyError, RuntimeError) as err:
             _LOGGER.error("Failed to activate HomeLink: %s", err)
 
@@ -1194,19 +1155,9 @@ class HomeLinkButton(OVMSEntity, ButtonEntity):
 class ModuleResetButton(OVMSEntity, ButtonEntity):
     """Button entity to reset OVMS module."""
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize module reset button.
-
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="module_reset",
-            name="Module Reset",
-            icon="mdi:restart",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+    _entity_key = "module_reset"
+    _attr_name = "Module Reset"
+    _attr_icon = "mdi:restart"
 
     async def async_press(self) -> None:
         """Handle button press - reset OVMS module."""
@@ -1214,55 +1165,55 @@ class ModuleResetButton(OVMSEntity, ButtonEntity):
             _LOGGER.error("OVMS Protocol client not available, cannot reset module")
             return
 
+        _LOGGER.info("Resetting OVMS module for vehicle %s", self.vehicle_id)
         try:
-            _LOGGER.info("Resetting OVMS module for vehicle %s", self.vehicle_id)
-            await self.coordinator.ovms_client.send_command("5")
             # Module will restart, don't refresh immediately
-            _LOGGER.info("Module reset command sent, module will restart")
-        except (ValueError, KeyError, RuntimeError) as err:
+            sent = await self.coordinator.async_send_command("5", refresh=False)
+        except OVMSConnectionError as err:
             _LOGGER.error("Failed to reset module: %s", err)
+            return
+        if sent:
+            _LOGGER.info("Module reset command sent, module will restart")
+        else:
+            _LOGGER.error("Failed to reset module for vehicle %s", self.vehicle_id)
 
 
 class VehicleTracker(OVMSEntity, TrackerEntity):
     """Device tracker entity for vehicle GPS location."""
 
+    _entity_key = "tracker"
+    _attr_name = "Location"
     _attr_icon = "mdi:car"
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize vehicle tracker.
+    _latitude: float | None = None
+    _longitude: float | None = None
+    _location_accuracy: int = 100
 
-        Args:
-            coordinator: Data coordinator
-            vehicle_id: OVMS vehicle ID
-        """
-        config = EntityConfig(
-            unique_id="tracker",
-            name="Location",
-            icon="mdi:car",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+    def _update_from_data(self) -> None:
+        """Derive position and accuracy from a single location lookup."""
+        location = self.coordinator.location
+        # Converted to float by the API client
+        self._latitude = location.get("latitude")
+        self._longitude = location.get("longitude")
+
+        # If GPS lock is available and not stale, assume good accuracy
+        if location.get("gpslock", False):
+            if not location.get("stalegps", True):
+                self._location_accuracy = 10  # Good GPS lock
+            else:
+                self._location_accuracy = 50  # GPS lock but stale
+        else:
+            self._location_accuracy = 100  # No GPS lock
 
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        lat = self.coordinator.data.get("location", {}).get("latitude")
-        if lat is not None:
-            try:
-                return float(lat)
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self._latitude
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        lon = self.coordinator.data.get("location", {}).get("longitude")
-        if lon is not None:
-            try:
-                return float(lon)
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self._longitude
 
     @property
     def source_type(self) -> SourceType:
@@ -1272,20 +1223,12 @@ class VehicleTracker(OVMSEntity, TrackerEntity):
     @property
     def battery_level(self) -> int | None:
         """Return the battery level of the device."""
-        return self.coordinator.data.get("status", {}).get("soc")
+        return self.coordinator.status.get("soc")
 
     @property
     def location_accuracy(self) -> int:
         """Return the location accuracy in meters."""
-        # If GPS lock is available and not stale, assume good accuracy
-        gpslock = self.coordinator.data.get("location", {}).get("gpslock", False)
-        stalegps = self.coordinator.data.get("location", {}).get("stalegps", True)
-
-        if gpslock and not stalegps:
-            return 10  # Good GPS lock
-        if gpslock:
-            return 50  # GPS lock but stale
-        return 100  # No GPS lock
+        return self._location_accuracy
 
 
 # =============================================================================
@@ -1293,287 +1236,203 @@ class VehicleTracker(OVMSEntity, TrackerEntity):
 # =============================================================================
 
 
-class FrontLeftDoorSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for front left door status."""
-
-    _attr_device_class = BinarySensorDeviceClass.DOOR
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize front left door sensor."""
-        config = EntityConfig(
-            unique_id="fl_dooropen",
-            name="Front Left Door",
-            icon="mdi:car-door",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if door is open."""
-        return self.coordinator.data.get("status", {}).get("fl_dooropen")
-
-
-class FrontRightDoorSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for front right door status."""
-
-    _attr_device_class = BinarySensorDeviceClass.DOOR
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize front right door sensor."""
-        config = EntityConfig(
-            unique_id="fr_dooropen",
-            name="Front Right Door",
-            icon="mdi:car-door",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if door is open."""
-        return self.coordinator.data.get("status", {}).get("fr_dooropen")
-
-
-class RearLeftDoorSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for rear left door status."""
-
-    _attr_device_class = BinarySensorDeviceClass.DOOR
-    _attr_entity_registry_enabled_default = False  # Disabled by default
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize rear left door sensor."""
-        config = EntityConfig(
-            unique_id="rl_dooropen",
-            name="Rear Left Door",
-            icon="mdi:car-door",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if door is open."""
-        return self.coordinator.data.get("status", {}).get("rl_dooropen")
-
-
-class RearRightDoorSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for rear right door status."""
-
-    _attr_device_class = BinarySensorDeviceClass.DOOR
-    _attr_entity_registry_enabled_default = False  # Disabled by default
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize rear right door sensor."""
-        config = EntityConfig(
-            unique_id="rr_dooropen",
-            name="Rear Right Door",
-            icon="mdi:car-door",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if door is open."""
-        return self.coordinator.data.get("status", {}).get("rr_dooropen")
-
-
-class BonnetSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for bonnet/hood status."""
-
-    _attr_device_class = BinarySensorDeviceClass.DOOR
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize bonnet sensor."""
-        config = EntityConfig(
-            unique_id="bt_open",
-            name="Bonnet",
-            icon="mdi:car",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if bonnet is open."""
-        return self.coordinator.data.get("status", {}).get("bt_open")
-
-
-class TrunkSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for trunk status."""
-
-    _attr_device_class = BinarySensorDeviceClass.DOOR
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize trunk sensor."""
-        config = EntityConfig(
-            unique_id="tr_open",
-            name="Trunk",
-            icon="mdi:car-back",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if trunk is open."""
-        return self.coordinator.data.get("status", {}).get("tr_open")
-
-
-class ChargePortSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for charge port status."""
-
-    _attr_device_class = BinarySensorDeviceClass.DOOR
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charge port sensor."""
-        config = EntityConfig(
-            unique_id="cp_dooropen",
-            name="Charge Port",
-            icon="mdi:ev-plug-type2",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if charge port is open."""
-        return self.coordinator.data.get("status", {}).get("cp_dooropen")
-
-
-class ParkingBrakeSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for parking brake status."""
-
-    _attr_entity_registry_enabled_default = False  # Disabled by default
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize parking brake sensor."""
-        config = EntityConfig(
-            unique_id="handbrake",
-            name="Parking Brake",
-            icon="mdi:car-brake-parking",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if parking brake is engaged."""
-        return self.coordinator.data.get("status", {}).get("handbrake")
-
-
-class PilotPresentSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for charge pilot present (plugged in)."""
-
-    _attr_device_class = BinarySensorDeviceClass.PLUG
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize pilot present sensor."""
-        config = EntityConfig(
-            unique_id="pilotpresent",
-            name="Charger Plugged In",
-            icon="mdi:ev-plug-type2",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+FrontLeftDoorSensor = _bucket_key_binary_sensor(
+    "FrontLeftDoorSensor",
+    "Binary sensor for front left door status.",
+    "status",
+    "fl_dooropen",
+    EntityConfig(
+        unique_id="fl_dooropen",
+        name="Front Left Door",
+        icon="mdi:car-door",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.DOOR,
+)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if charger is plugged in."""
-        return self.coordinator.data.get("status", {}).get("pilotpresent")
 
+FrontRightDoorSensor = _bucket_key_binary_sensor(
+    "FrontRightDoorSensor",
+    "Binary sensor for front right door status.",
+    "status",
+    "fr_dooropen",
+    EntityConfig(
+        unique_id="fr_dooropen",
+        name="Front Right Door",
+        icon="mdi:car-door",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.DOOR,
+)
 
-class CarOnSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for car on/started status."""
 
-    _attr_device_class = BinarySensorDeviceClass.RUNNING
+RearLeftDoorSensor = _bucket_key_binary_sensor(
+    "RearLeftDoorSensor",
+    "Binary sensor for rear left door status.",
+    "status",
+    "rl_dooropen",
+    EntityConfig(
+        unique_id="rl_dooropen",
+        name="Rear Left Door",
+        icon="mdi:car-door",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.DOOR,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default
+)
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize car on sensor."""
-        config = EntityConfig(
-            unique_id="caron",
-            name="Car Started",
-            icon="mdi:car-key",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if car is on/started."""
-        return self.coordinator.data.get("status", {}).get("caron")
+RearRightDoorSensor = _bucket_key_binary_sensor(
+    "RearRightDoorSensor",
+    "Binary sensor for rear right door status.",
+    "status",
+    "rr_dooropen",
+    EntityConfig(
+        unique_id="rr_dooropen",
+        name="Rear Right Door",
+        icon="mdi:car-door",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.DOOR,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default
+)
 
 
-class HVACSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for HVAC / climate control status."""
+BonnetSensor = _bucket_key_binary_sensor(
+    "BonnetSensor",
+    "Binary sensor for bonnet/hood status.",
+    "status",
+    "bt_open",
+    EntityConfig(
+        unique_id="bt_open",
+        name="Bonnet",
+        icon="mdi:car",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.DOOR,
+)
 
-    _attr_device_class = BinarySensorDeviceClass.RUNNING
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize HVAC sensor."""
-        config = EntityConfig(
-            unique_id="hvac",
-            name="HVAC",
-            icon="mdi:air-conditioner",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+TrunkSensor = _bucket_key_binary_sensor(
+    "TrunkSensor",
+    "Binary sensor for trunk status.",
+    "status",
+    "tr_open",
+    EntityConfig(
+        unique_id="tr_open",
+        name="Trunk",
+        icon="mdi:car-back",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.DOOR,
+)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if HVAC / climate control is active."""
-        return self.coordinator.data.get("status", {}).get("hvac")
 
+ChargePortSensor = _bucket_key_binary_sensor(
+    "ChargePortSensor",
+    "Binary sensor for charge port status.",
+    "status",
+    "cp_dooropen",
+    EntityConfig(
+        unique_id="cp_dooropen",
+        name="Charge Port",
+        icon="mdi:ev-plug-type2",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.DOOR,
+)
 
-class HeadlightsSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for headlights status."""
 
-    _attr_device_class = BinarySensorDeviceClass.LIGHT
-    _attr_entity_registry_enabled_default = False  # Disabled by default
+ParkingBrakeSensor = _bucket_key_binary_sensor(
+    "ParkingBrakeSensor",
+    "Binary sensor for parking brake status.",
+    "status",
+    "handbrake",
+    EntityConfig(
+        unique_id="handbrake",
+        name="Parking Brake",
+        icon="mdi:car-brake-parking",
+    ),
+    _attr_entity_registry_enabled_default=False,  # Disabled by default
+)
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize headlights sensor."""
-        config = EntityConfig(
-            unique_id="headlights",
-            name="Headlights",
-            icon="mdi:car-light-high",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if headlights are on."""
-        return self.coordinator.data.get("status", {}).get("headlights")
+PilotPresentSensor = _bucket_key_binary_sensor(
+    "PilotPresentSensor",
+    "Binary sensor for charge pilot present (plugged in).",
+    "status",
+    "pilotpresent",
+    EntityConfig(
+        unique_id="pilotpresent",
+        name="Charger Plugged In",
+        icon="mdi:ev-plug-type2",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.PLUG,
+)
 
 
-class AlarmSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for alarm sounding status."""
+CarOnSensor = _bucket_key_binary_sensor(
+    "CarOnSensor",
+    "Binary sensor for car on/started status.",
+    "status",
+    "caron",
+    EntityConfig(
+        unique_id="caron",
+        name="Car Started",
+        icon="mdi:car-key",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.RUNNING,
+)
 
-    _attr_device_class = BinarySensorDeviceClass.SAFETY
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize alarm sensor."""
-        config = EntityConfig(
-            unique_id="alarmsounding",
-            name="Alarm",
-            icon="mdi:car-emergency",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+HVACSensor = _bucket_key_binary_sensor(
+    "HVACSensor",
+    "Binary sensor for HVAC / climate control status.",
+    "status",
+    "hvac",
+    EntityConfig(
+        unique_id="hvac",
+        name="HVAC",
+        icon="mdi:air-conditioner",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.RUNNING,
+)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if alarm is sounding."""
-        return self.coordinator.data.get("status", {}).get("alarmsounding")
 
+HeadlightsSensor = _bucket_key_binary_sensor(
+    "HeadlightsSensor",
+    "Binary sensor for headlights status.",
+    "status",
+    "headlights",
+    EntityConfig(
+        unique_id="headlights",
+        name="Headlights",
+        icon="mdi:car-light-high",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.LIGHT,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default
+)
 
-class GPSLockSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for GPS lock status."""
 
-    _attr_entity_registry_enabled_default = False  # Disabled by default
+AlarmSensor = _bucket_key_binary_sensor(
+    "AlarmSensor",
+    "Binary sensor for alarm sounding status.",
+    "status",
+    "alarmsounding",
+    EntityConfig(
+        unique_id="alarmsounding",
+        name="Alarm",
+        icon="mdi:car-emergency",
+    ),
+    _attr_device_class=BinarySensorDeviceClass.SAFETY,
+)
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize GPS lock sensor."""
-        config = EntityConfig(
-            unique_id="gpslock",
-            name="GPS Lock",
-            icon="mdi:crosshairs-gps",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if GPS has a lock."""
-        return self.coordinator.data.get("location", {}).get("gpslock")
+GPSLockSensor = _bucket_key_binary_sensor(
+    "GPSLockSensor",
+    "Binary sensor for GPS lock status.",
+    "location",
+    "gpslock",
+    EntityConfig(
+        unique_id="gpslock",
+        name="GPS Lock",
+        icon="mdi:crosshairs-gps",
+    ),
+    _attr_entity_registry_enabled_default=False,  # Disabled by default
+)
 
 
 # =============================================================================
@@ -1581,72 +1440,54 @@ class GPSLockSensor(OVMSEntity, BinarySensorEntity):
 # =============================================================================
 
 
-class PEMTemperatureSensor(OVMSEntity, SensorEntity):
-    """Sensor for Power Electronics Module temperature."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_entity_registry_enabled_default = False  # Disabled by default (technical)
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize PEM temperature sensor."""
-        config = EntityConfig(
-            unique_id="temp_pem",
-            name="PEM Temperature",
-            icon="mdi:thermometer",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return PEM temperature."""
-        return self.coordinator.data.get("status", {}).get("temperature_pem")
-
-
-class MotorTemperatureSensor(OVMSEntity, SensorEntity):
-    """Sensor for motor temperature."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize motor temperature sensor."""
-        config = EntityConfig(
-            unique_id="temp_motor",
-            name="Motor Temperature",
-            icon="mdi:engine",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return motor temperature."""
-        return self.coordinator.data.get("status", {}).get("temperature_motor")
+PEMTemperatureSensor = _bucket_key_sensor(
+    "PEMTemperatureSensor",
+    "Sensor for Power Electronics Module temperature.",
+    "status",
+    "temperature_pem",
+    EntityConfig(
+        unique_id="temp_pem",
+        name="PEM Temperature",
+        icon="mdi:thermometer",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    _attr_device_class=SensorDeviceClass.TEMPERATURE,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (technical)
+)
 
 
-class ChargerTemperatureSensor(OVMSEntity, SensorEntity):
-    """Sensor for charger temperature."""
+MotorTemperatureSensor = _bucket_key_sensor(
+    "MotorTemperatureSensor",
+    "Sensor for motor temperature.",
+    "status",
+    "temperature_motor",
+    EntityConfig(
+        unique_id="temp_motor",
+        name="Motor Temperature",
+        icon="mdi:engine",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    _attr_device_class=SensorDeviceClass.TEMPERATURE,
+)
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_entity_registry_enabled_default = False  # Disabled by default (technical)
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charger temperature sensor."""
-        config = EntityConfig(
-            unique_id="temp_charger",
-            name="Charger Temperature",
-            icon="mdi:thermometer",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return charger temperature."""
-        return self.coordinator.data.get("status", {}).get("temperature_charger")
+ChargerTemperatureSensor = _bucket_key_sensor(
+    "ChargerTemperatureSensor",
+    "Sensor for charger temperature.",
+    "status",
+    "temperature_charger",
+    EntityConfig(
+        unique_id="temp_charger",
+        name="Charger Temperature",
+        icon="mdi:thermometer",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    _attr_device_class=SensorDeviceClass.TEMPERATURE,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (technical)
+)
 
 
 # =============================================================================
@@ -1654,163 +1495,121 @@ class ChargerTemperatureSensor(OVMSEntity, SensorEntity):
 # =============================================================================
 
 
-class BatteryCapacitySensor(OVMSEntity, SensorEntity):
-    """Sensor for battery capacity."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-    _attr_device_class = SensorDeviceClass.ENERGY_STORAGE
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize battery capacity sensor."""
-        config = EntityConfig(
-            unique_id="batt_capacity",
-            name="Battery Capacity",
-            icon="mdi:battery-high",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return battery capacity in kWh."""
-        return self.coordinator.data.get("charge", {}).get("batt_capacity")
-
-
-class CACSensor(OVMSEntity, SensorEntity):
-    """Sensor for Calculated Amp Capacity (CAC)."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "Ah"
-    _attr_entity_registry_enabled_default = False  # Disabled by default (technical)
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize CAC sensor."""
-        config = EntityConfig(
-            unique_id="cac",
-            name="CAC (Amp Capacity)",
-            icon="mdi:battery-heart-variant",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return calculated amp capacity."""
-        return self.coordinator.data.get("charge", {}).get("cac100")
-
-
-class DriveModeSensor(OVMSEntity, SensorEntity):
-    """Sensor for drive mode."""
-
-    _attr_entity_registry_enabled_default = False  # Disabled by default
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize drive mode sensor."""
-        config = EntityConfig(
-            unique_id="drivemode",
-            name="Drive Mode",
-            icon="mdi:car-cruise-control",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> str | None:
-        """Return drive mode."""
-        return self.coordinator.data.get("location", {}).get("drivemode")
-
-
-class PowerSensor(OVMSEntity, SensorEntity):
-    """Sensor for instantaneous power draw/output."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_device_class = SensorDeviceClass.POWER
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize power sensor."""
-        config = EntityConfig(
-            unique_id="power",
-            name="Power",
-            icon="mdi:flash",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return instantaneous power."""
-        return self.coordinator.data.get("location", {}).get("power")
+BatteryCapacitySensor = _bucket_key_sensor(
+    "BatteryCapacitySensor",
+    "Sensor for battery capacity.",
+    "charge",
+    "batt_capacity",
+    EntityConfig(
+        unique_id="batt_capacity",
+        name="Battery Capacity",
+        icon="mdi:battery-high",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    _attr_device_class=SensorDeviceClass.ENERGY_STORAGE,
+)
 
 
-class InverterPowerSensor(OVMSEntity, SensorEntity):
-    """Sensor for inverter power."""
+CACSensor = _bucket_key_sensor(
+    "CACSensor",
+    "Sensor for Calculated Amp Capacity (CAC).",
+    "charge",
+    "cac100",
+    EntityConfig(
+        unique_id="cac",
+        name="CAC (Amp Capacity)",
+        icon="mdi:battery-heart-variant",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement="Ah",
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (technical)
+    _attr_entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_entity_registry_enabled_default = False  # Disabled by default (technical)
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize inverter power sensor."""
-        config = EntityConfig(
-            unique_id="invpower",
-            name="Inverter Power",
-            icon="mdi:current-ac",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+DriveModeSensor = _bucket_key_sensor(
+    "DriveModeSensor",
+    "Sensor for drive mode.",
+    "location",
+    "drivemode",
+    EntityConfig(
+        unique_id="drivemode",
+        name="Drive Mode",
+        icon="mdi:car-cruise-control",
+    ),
+    _attr_entity_registry_enabled_default=False,  # Disabled by default
+)
 
-    @property
-    def native_value(self) -> int | None:
-        """Return inverter power in kW."""
-        return self.coordinator.data.get("location", {}).get("invpower")
 
+PowerSensor = _bucket_key_sensor(
+    "PowerSensor",
+    "Sensor for instantaneous power draw/output.",
+    "location",
+    "power",
+    EntityConfig(
+        unique_id="power",
+        name="Power",
+        icon="mdi:flash",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfPower.WATT,
+    _attr_device_class=SensorDeviceClass.POWER,
+)
 
-class InverterEfficiencySensor(OVMSEntity, SensorEntity):
-    """Sensor for inverter efficiency."""
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_entity_registry_enabled_default = False  # Disabled by default (technical)
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
+InverterPowerSensor = _bucket_key_sensor(
+    "InverterPowerSensor",
+    "Sensor for inverter power.",
+    "location",
+    "invpower",
+    EntityConfig(
+        unique_id="invpower",
+        name="Inverter Power",
+        icon="mdi:current-ac",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfPower.KILO_WATT,
+    _attr_device_class=SensorDeviceClass.POWER,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (technical)
+    _attr_entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize inverter efficiency sensor."""
-        config = EntityConfig(
-            unique_id="invefficiency",
-            name="Inverter Efficiency",
-            icon="mdi:gauge",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> int | None:
-        """Return inverter efficiency percentage."""
-        return self.coordinator.data.get("location", {}).get("invefficiency")
+InverterEfficiencySensor = _bucket_key_sensor(
+    "InverterEfficiencySensor",
+    "Sensor for inverter efficiency.",
+    "location",
+    "invefficiency",
+    EntityConfig(
+        unique_id="invefficiency",
+        name="Inverter Efficiency",
+        icon="mdi:gauge",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=PERCENTAGE,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (technical)
+    _attr_entity_category=EntityCategory.DIAGNOSTIC,
+)
 
 
 class TripMeterSensor(OVMSEntity, SensorEntity):
     """Sensor for trip meter (resettable distance)."""
 
+    _entity_key = "tripmeter"
+    _attr_name = "Trip Meter"
+    _attr_icon = "mdi:counter"
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
     _attr_device_class = SensorDeviceClass.DISTANCE
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize trip meter sensor."""
-        config = EntityConfig(
-            unique_id="tripmeter",
-            name="Trip Meter",
-            icon="mdi:counter",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
     @property
     def native_value(self) -> float | None:
         """Return trip meter distance."""
         # Try location first, then status
-        tripmeter = self.coordinator.data.get("location", {}).get("tripmeter")
+        tripmeter = self.coordinator.location.get("tripmeter")
         if tripmeter is None:
-            tripmeter = self.coordinator.data.get("status", {}).get("tripmeter")
+            tripmeter = self.coordinator.status.get("tripmeter")
         return tripmeter
 
 
@@ -1819,159 +1618,118 @@ class TripMeterSensor(OVMSEntity, SensorEntity):
 # =============================================================================
 
 
-class ChargeTypeSensor(OVMSEntity, SensorEntity):
-    """Sensor for charge type (AC/DC, Type 2, CCS, etc.)."""
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charge type sensor."""
-        config = EntityConfig(
-            unique_id="chargetype",
-            name="Charge Type",
-            icon="mdi:ev-plug-type2",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> str | None:
-        """Return charge type."""
-        return self.coordinator.data.get("charge", {}).get("chargetype")
-
-
-class ChargeLimitRangeSensor(OVMSEntity, SensorEntity):
-    """Sensor for charge limit range."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
-    _attr_device_class = SensorDeviceClass.DISTANCE
-    _attr_entity_registry_enabled_default = False  # Disabled by default
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charge limit range sensor."""
-        config = EntityConfig(
-            unique_id="charge_limit_range",
-            name="Charge Limit Range",
-            icon="mdi:map-marker-distance",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return charge limit range in km."""
-        return self.coordinator.data.get("charge", {}).get("charge_limit_range")
-
-
-class GridKwhSensor(OVMSEntity, SensorEntity):
-    """Sensor for energy from grid during current charge session."""
-
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_entity_registry_enabled_default = False  # Disabled by default (technical)
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize grid kWh sensor."""
-        config = EntityConfig(
-            unique_id="charge_kwh_grid",
-            name="Charge Grid Energy",
-            icon="mdi:transmission-tower",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return grid energy in kWh."""
-        return self.coordinator.data.get("charge", {}).get("charge_kwh_grid")
-
-
-class TotalGridKwhSensor(OVMSEntity, SensorEntity):
-    """Sensor for total lifetime energy from grid."""
-
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_entity_registry_enabled_default = False  # Disabled by default (technical)
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize total grid kWh sensor."""
-        config = EntityConfig(
-            unique_id="charge_kwh_grid_total",
-            name="Total Grid Energy",
-            icon="mdi:transmission-tower",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return total grid energy in kWh."""
-        return self.coordinator.data.get("charge", {}).get("charge_kwh_grid_total")
-
-
-class ChargerEfficiencySensor(OVMSEntity, SensorEntity):
-    """Sensor for charger efficiency."""
+ChargeTypeSensor = _bucket_key_sensor(
+    "ChargeTypeSensor",
+    "Sensor for charge type (AC/DC, Type 2, CCS, etc.).",
+    "charge",
+    "chargetype",
+    EntityConfig(
+        unique_id="chargetype",
+        name="Charge Type",
+        icon="mdi:ev-plug-type2",
+    ),
+)
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_entity_registry_enabled_default = False  # Disabled by default (technical)
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charger efficiency sensor."""
-        config = EntityConfig(
-            unique_id="chargerefficiency",
-            name="Charger Efficiency",
-            icon="mdi:gauge",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+ChargeLimitRangeSensor = _bucket_key_sensor(
+    "ChargeLimitRangeSensor",
+    "Sensor for charge limit range.",
+    "charge",
+    "charge_limit_range",
+    EntityConfig(
+        unique_id="charge_limit_range",
+        name="Charge Limit Range",
+        icon="mdi:map-marker-distance",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfLength.KILOMETERS,
+    _attr_device_class=SensorDeviceClass.DISTANCE,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default
+)
 
-    @property
-    def native_value(self) -> int | None:
-        """Return charger efficiency percentage."""
-        return self.coordinator.data.get("charge", {}).get("chargerefficiency")
 
+GridKwhSensor = _bucket_key_sensor(
+    "GridKwhSensor",
+    "Sensor for energy from grid during current charge session.",
+    "charge",
+    "charge_kwh_grid",
+    EntityConfig(
+        unique_id="charge_kwh_grid",
+        name="Charge Grid Energy",
+        icon="mdi:transmission-tower",
+    ),
+    _attr_state_class=SensorStateClass.TOTAL_INCREASING,
+    _attr_native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    _attr_device_class=SensorDeviceClass.ENERGY,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (technical)
+)
 
-class ChargerPowerInputSensor(OVMSEntity, SensorEntity):
-    """Sensor for charger power input (power drawn from wallbox)."""
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_device_class = SensorDeviceClass.POWER
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charger power input sensor."""
-        config = EntityConfig(
-            unique_id="chargepowerinput",
-            name="Charger Power Input",
-            icon="mdi:flash",
-        )
-        super().__init__(coordinator, config, vehicle_id)
+TotalGridKwhSensor = _bucket_key_sensor(
+    "TotalGridKwhSensor",
+    "Sensor for total lifetime energy from grid.",
+    "charge",
+    "charge_kwh_grid_total",
+    EntityConfig(
+        unique_id="charge_kwh_grid_total",
+        name="Total Grid Energy",
+        icon="mdi:transmission-tower",
+    ),
+    _attr_state_class=SensorStateClass.TOTAL_INCREASING,
+    _attr_native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    _attr_device_class=SensorDeviceClass.ENERGY,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (technical)
+    _attr_entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-    @property
-    def native_value(self) -> int | None:
-        """Return charger power input in watts."""
-        return self.coordinator.data.get("charge", {}).get("chargepowerinput")
 
+ChargerEfficiencySensor = _bucket_key_sensor(
+    "ChargerEfficiencySensor",
+    "Sensor for charger efficiency.",
+    "charge",
+    "chargerefficiency",
+    EntityConfig(
+        unique_id="chargerefficiency",
+        name="Charger Efficiency",
+        icon="mdi:gauge",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=PERCENTAGE,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (technical)
+    _attr_entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-class ChargeKwhSensor(OVMSEntity, SensorEntity):
-    """Sensor for energy charged in current session."""
 
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-    _attr_device_class = SensorDeviceClass.ENERGY
+ChargerPowerInputSensor = _bucket_key_sensor(
+    "ChargerPowerInputSensor",
+    "Sensor for charger power input (power drawn from wallbox).",
+    "charge",
+    "chargepowerinput",
+    EntityConfig(
+        unique_id="chargepowerinput",
+        name="Charger Power Input",
+        icon="mdi:flash",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfPower.WATT,
+    _attr_device_class=SensorDeviceClass.POWER,
+)
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize charge kWh sensor."""
-        config = EntityConfig(
-            unique_id="chargekwh",
-            name="Charge Session Energy",
-            icon="mdi:battery-charging",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return energy charged in kWh."""
-        return self.coordinator.data.get("charge", {}).get("chargekwh")
+ChargeKwhSensor = _bucket_key_sensor(
+    "ChargeKwhSensor",
+    "Sensor for energy charged in current session.",
+    "charge",
+    "chargekwh",
+    EntityConfig(
+        unique_id="chargekwh",
+        name="Charge Session Energy",
+        icon="mdi:battery-charging",
+    ),
+    _attr_state_class=SensorStateClass.TOTAL_INCREASING,
+    _attr_native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    _attr_device_class=SensorDeviceClass.ENERGY,
+)
 
 
 # =============================================================================
@@ -1982,135 +1740,97 @@ class ChargeKwhSensor(OVMSEntity, SensorEntity):
 class FirmwareVersionSensor(OVMSEntity, SensorEntity):
     """Sensor for OVMS firmware version."""
 
+    _entity_key = "firmware"
+    _attr_name = "Firmware Version"
+    _attr_icon = "mdi:memory"
     _attr_entity_registry_enabled_default = False  # Disabled by default (diagnostic)
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize firmware version sensor."""
-        config = EntityConfig(
-            unique_id="firmware",
-            name="Firmware Version",
-            icon="mdi:memory",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
     @property
     def native_value(self) -> str | None:
         """Return firmware version."""
-        status = self.coordinator.data.get("status", {})
+        status = self.coordinator.status
         return status.get("m_firmware") or status.get("m_version")
 
 
-class HardwareVersionSensor(OVMSEntity, SensorEntity):
-    """Sensor for OVMS hardware version."""
-
-    _attr_entity_registry_enabled_default = False  # Disabled by default (diagnostic)
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize hardware version sensor."""
-        config = EntityConfig(
-            unique_id="hardware",
-            name="Hardware Version",
-            icon="mdi:chip",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> str | None:
-        """Return hardware version."""
-        return self.coordinator.data.get("status", {}).get("m_hardware")
-
-
-class CanWriteSensor(OVMSEntity, BinarySensorEntity):
-    """Binary sensor for CAN write capability."""
-
-    _attr_entity_registry_enabled_default = False  # Disabled by default (diagnostic)
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize CAN write sensor."""
-        config = EntityConfig(
-            unique_id="canwrite",
-            name="CAN Write Enabled",
-            icon="mdi:database-edit",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if CAN write is enabled."""
-        return self.coordinator.data.get("status", {}).get("canwrite")
-
-
-class ServiceRangeSensor(OVMSEntity, SensorEntity):
-    """Sensor for distance until service is due."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
-    _attr_device_class = SensorDeviceClass.DISTANCE
-    _attr_entity_registry_enabled_default = False  # Disabled by default
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize service range sensor."""
-        config = EntityConfig(
-            unique_id="servicerange",
-            name="Service Range",
-            icon="mdi:wrench-clock",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return distance until service in km."""
-        value = self.coordinator.data.get("status", {}).get("servicerange")
-        return value if value is not None and value >= 0 else None
-
+HardwareVersionSensor = _bucket_key_sensor(
+    "HardwareVersionSensor",
+    "Sensor for OVMS hardware version.",
+    "status",
+    "m_hardware",
+    EntityConfig(
+        unique_id="hardware",
+        name="Hardware Version",
+        icon="mdi:chip",
+    ),
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (diagnostic)
+    _attr_entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-class ServiceTimeSensor(OVMSEntity, SensorEntity):
-    """Sensor for days until service is due."""
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTime.DAYS
-    _attr_entity_registry_enabled_default = False  # Disabled by default
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
+CanWriteSensor = _bucket_key_binary_sensor(
+    "CanWriteSensor",
+    "Binary sensor for CAN write capability.",
+    "status",
+    "canwrite",
+    EntityConfig(
+        unique_id="canwrite",
+        name="CAN Write Enabled",
+        icon="mdi:database-edit",
+    ),
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (diagnostic)
+    _attr_entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize service time sensor."""
-        config = EntityConfig(
-            unique_id="servicetime",
-            name="Service Time",
-            icon="mdi:wrench-clock",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return days until service."""
-        value = self.coordinator.data.get("status", {}).get("servicetime")
-        return value if value is not None and value >= 0 else None
 
+ServiceRangeSensor = _bucket_key_sensor(
+    "ServiceRangeSensor",
+    "Sensor for distance until service is due.",
+    "status",
+    "servicerange",  # None while not set (negative values)
+    EntityConfig(
+        unique_id="servicerange",
+        name="Service Range",
+        icon="mdi:wrench-clock",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfLength.KILOMETERS,
+    _attr_device_class=SensorDeviceClass.DISTANCE,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default
+    _attr_entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-class ModemModeSensor(OVMSEntity, SensorEntity):
-    """Sensor for modem mode (2G/3G/4G)."""
 
-    _attr_entity_registry_enabled_default = False  # Disabled by default (diagnostic)
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
+ServiceTimeSensor = _bucket_key_sensor(
+    "ServiceTimeSensor",
+    "Sensor for days until service is due.",
+    "status",
+    "servicetime",  # None while not set (negative values)
+    EntityConfig(
+        unique_id="servicetime",
+        name="Service Time",
+        icon="mdi:wrench-clock",
+    ),
+    _attr_state_class=SensorStateClass.MEASUREMENT,
+    _attr_native_unit_of_measurement=UnitOfTime.DAYS,
+    _attr_entity_registry_enabled_default=False,  # Disabled by default
+    _attr_entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize modem mode sensor."""
-        config = EntityConfig(
-            unique_id="mdm_mode",
-            name="Modem Mode",
-            icon="mdi:signal-cellular-3",
-        )
-        super().__init__(coordinator, config, vehicle_id)
 
-    @property
-    def native_value(self) -> str | None:
-        """Return modem mode."""
-        return self.coordinator.data.get("status", {}).get("m_mdm_mode")
+ModemModeSensor = _bucket_key_sensor(
+    "ModemModeSensor",
+    "Sensor for modem mode (2G/3G/4G).",
+    "status",
+    "m_mdm_mode",
+    EntityConfig(
+        unique_id="mdm_mode",
+        name="Modem Mode",
+        icon="mdi:signal-cellular-3",
+    ),
+    _attr_entity_registry_enabled_default=False,  # Disabled by default (diagnostic)
+    _attr_entity_category=EntityCategory.DIAGNOSTIC,
+)
 
 
 # =============================================================================
@@ -2121,26 +1841,22 @@ class ModemModeSensor(OVMSEntity, SensorEntity):
 class TPMSResetButton(OVMSEntity, ButtonEntity):
     """Button to reset/auto-learn TPMS sensors."""
 
+    _entity_key = "tpms_reset"
+    _attr_name = "TPMS Auto-Learn"
+    _attr_icon = "mdi:car-tire-alert"
     _attr_entity_registry_enabled_default = False  # Disabled by default
 
-    def __init__(self, coordinator: Any, vehicle_id: str) -> None:
-        """Initialize TPMS reset button."""
-        config = EntityConfig(
-            unique_id="tpms_reset",
-            name="TPMS Auto-Learn",
-            icon="mdi:car-tire-alert",
-        )
-        super().__init__(coordinator, config, vehicle_id)
-
     async def async_press(self) -> None:
         """Handle button press - reset TPMS mapping."""
         if not self.coordinator.ovms_client:
             _LOGGER.error("OVMS Protocol client not available, cannot reset TPMS")
             return
 
-        try:
-            _LOGGER.info("Resetting TPMS mapping for vehicle %s", self.vehicle_id)
-            await self.coordinator.ovms_client.send_command("7,tpms map reset")
-            await self.coordinator.async_request_refresh()
-        except (ValueError, KeyError, RuntimeError) as err:
-            _LOGGER.error("Failed to reset TPMS: %s", err)
+        _LOGGER.info("Resetting TPMS mapping for vehicle %s", self.vehicle_id)
+        # Polled data does not change until the sensors are learned, so a
+        # refresh would only repeat the last poll. The coordinator handles and
+        # logs command errors itself.
+        if not await self.coordinator.async_send_command(
+            "7,tpms map reset", refresh=False
+        ):
+            _LOGGER.error("Failed to reset TPMS for vehicle %s", self.vehicle_id)
@@ -6,7 +6,11 @@ that don't fit into standard entity types.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import partial
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -86,220 +90,126 @@ PARAMETER_SCHEMA = vol.Schema(
 
 def _get_coordinator(hass: HomeAssistant, vehicle_id: str):
     """Get coordinator for a specific vehicle."""
-    if DOMAIN not in hass.data:
-        return None
-
-    # Find the coordinator for this vehicle
-    for entry_id, entry_data in hass.data[DOMAIN].items():
-        if isinstance(entry_data, dict):
-            coordinator = entry_data.get("coordinator")
-            if coordinator and coordinator.vehicle_id == vehicle_id:
-                return coordinator
-
-    return None
-
-
-async def async_send_command(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Handle send_command service call.
-
-    Sends a generic command to the vehicle using Command 7.
-
-    Args:
-        hass: Home Assistant instance
-        call: Service call data containing vehicle_id and command
-    """
-    vehicle_id = call.data["vehicle_id"]
-    command = call.data["command"]
-
-    coordinator = _get_coordinator(hass, vehicle_id)
-    if not coordinator:
-        _LOGGER.error("Vehicle %s not found", vehicle_id)
-        return
-
-    if not coordinator.ovms_client:
-        _LOGGER.error("OVMS Protocol client not available for vehicle %s", vehicle_id)
-        return
-
-    try:
-        # Command 7 is for generic commands
-        _LOGGER.info("Sending command to %s: %s", vehicle_id, command)
-        await coordinator.ovms_client.send_command(f"7,{command}")
-    except Exception as err:
-        _LOGGER.error("Failed to send command to %s: %s", vehicle_id, err)
-
-
-async def async_send_sms(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Handle send_sms service call.
-
-    Sends an SMS via the vehicle's modem using Command 40.
-
-    Args:
-        hass: Home Assistant instance
-        call: Service call data containing vehicle_id, phone_number, and message
-    """
-    vehicle_id = call.data["vehicle_id"]
-    phone_number = call.data["phone_number"]
-    message = call.data["message"]
-
-    coordinator = _get_coordinator(hass, vehicle_id)
-    if not coordinator:
-        _LOGGER.error("Vehicle %s not found", vehicle_id)
-        return
-
-    if not coordinator.ovms_client:
-        _LOGGER.error("OVMS Protocol client not available for vehicle %s", vehicle_id)
-        return
-
-    try:
-        # Command 40 is for sending SMS
-        _LOGGER.info("Sending SMS from %s to %s", vehicle_id, phone_number)
-        await coordinator.ovms_client.send_command(f"40,{phone_number},{message}")
-    except Exception as err:
-        _LOGGER.error("Failed to send SMS from %s: %s", vehicle_id, err)
-
-
-async def async_set_charge_timer(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Handle set_charge_timer service call.
-
-    Sets or clears the charge timer using Command 17.
-
-    Args:
-        hass: Home Assistant instance
-        call: Service call data containing vehicle_id, start_time, and enabled
-    """
-    vehicle_id = call.data["vehicle_id"]
-    start_time = call.data["start_time"]
-    enabled = call.data.get("enabled", True)
-
-    coordinator = _get_coordinator(hass, vehicle_id)
-    if not coordinator:
-        _LOGGER.error("Vehicle %s not found", vehicle_id)
-        return
-
-    if not coordinator.ovms_client:
-        _LOGGER.error("OVMS Protocol client not available for vehicle %s", vehicle_id)
-        return
-
-    try:
-        # Command 17 is for charge timer
-        # Format varies by vehicle, common format is mode,start_hour,start_min
-        if enabled:
-            parts = start_time.split(":")
-            if len(parts) == 2:
-                hour = int(parts[0])
-                minute = int(parts[1])
-                _LOGGER.info("Setting charge timer for %s to %s", vehicle_id, start_time)
-                await coordinator.ovms_client.send_command(f"17,1,{hour},{minute}")
-            else:
-                _LOGGER.error("Invalid time format: %s (expected HH:MM)", start_time)
-        else:
-            _LOGGER.info("Disabling charge timer for %s", vehicle_id)
-            await coordinator.ovms_client.send_command("17,0")
-    except Exception as err:
-        _LOGGER.error("Failed to set charge timer for %s: %s", vehicle_id, err)
-
-
-async def async_wakeup_subsystem(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Handle wakeup_subsystem service call.
-
-    Wakes a specific vehicle subsystem using Command 19.
-
-    Args:
-        hass: Home Assistant instance
-        call: Service call data containing vehicle_id and subsystem
-    """
-    vehicle_id = call.data["vehicle_id"]
-    subsystem = call.data["subsystem"]
-
-    coordinator = _get_coordinator(hass, vehicle_id)
-    if not coordinator:
-        _LOGGER.error("Vehicle %s not found", vehicle_id)
-        return
-
-    if not coordinator.ovms_client:
-        _LOGGER.error("OVMS Protocol client not available for vehicle %s", vehicle_id)
-        return
+    # Indexed by vehicle ID in async_setup_entry
+    return hass.data.get(DOMAIN, {}).get("coordinators", {}).get(vehicle_id)
 
-    try:
-        # Command 19 is for waking specific subsystems
-        _LOGGER.info("Waking subsystem %d for %s", subsystem, vehicle_id)
-        await coordinator.ovms_client.send_command(f"19,{subsystem}")
-    except Exception as err:
-        _LOGGER.error("Failed to wake subsystem for %s: %s", vehicle_id, err)
 
+def _charge_timer_command(data: Mapping[str, Any]) -> str | None:
+    """Build the charge timer command (Command 17).
 
-async def async_tpms_map_wheel(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Handle tpms_map_wheel service call.
-
-    Maps a TPMS sensor to a wheel position using Command 7.
+    Format varies by vehicle, common format is mode,start_hour,start_min.
 
     Args:
-        hass: Home Assistant instance
-        call: Service call data containing vehicle_id, wheel, and sensor_id
-    """
-    vehicle_id = call.data["vehicle_id"]
-    wheel = call.data["wheel"]
-    sensor_id = call.data["sensor_id"]
-
-    coordinator = _get_coordinator(hass, vehicle_id)
-    if not coordinator:
-        _LOGGER.error("Vehicle %s not found", vehicle_id)
-        return
-
-    if not coordinator.ovms_client:
-        _LOGGER.error("OVMS Protocol client not available for vehicle %s", vehicle_id)
-        return
-
-    try:
-        # TPMS mapping uses generic command
-        _LOGGER.info("Mapping TPMS sensor %s to wheel %s for %s", sensor_id, wheel, vehicle_id)
-        await coordinator.ovms_client.send_command(f"7,tpms map {wheel} {sensor_id}")
-        await coordinator.async_request_refresh()
-    except Exception as err:
-        _LOGGER.error("Failed to map TPMS for %s: %s", vehicle_id, err)
-
+        data: Validated service call data
 
-async def async_get_feature(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Handle get_feature service call.
-
-    Gets a module feature using Command 1.
-
-    Args:
-        hass: Home Assistant instance
-        call: Service call data containing vehicle_id and feature_number
+    Returns:
+        Command string, or None if the start time is invalid
     """
-    vehicle_id = call.data["vehicle_id"]
-    feature_number = call.data["feature_number"]
-
-    coordinator = _get_coordinator(hass, vehicle_id)
-    if not coordinator:
-        _LOGGER.error("Vehicle %s not found", vehicle_id)
-        return
-
-    if not coordinator.ovms_client:
-        _LOGGER.error("OVMS Protocol client not available for vehicle %s", vehicle_id)
-        return
-
-    try:
-        # Command 1 is for getting features
-        _LOGGER.info("Getting feature %d for %s", feature_number, vehicle_id)
-        await coordinator.ovms_client.send_command("1")
-    except Exception as err:
-        _LOGGER.error("Failed to get feature for %s: %s", vehicle_id, err)
-
-
-async def async_set_feature(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Handle set_feature service call.
-
-    Sets a module feature using Command 2.
+    if not data.get("enabled", True):
+        return "17,0"
+    hour, sep, minute = data["start_time"].partition(":")
+    if not (sep and hour.isdigit() and minute.isdigit()):
+        _LOGGER.error("Invalid time format: %s (expected HH:MM)", data["start_time"])
+        return None
+    return f"17,1,{int(hour)},{int(minute)}"
+
+
+@dataclass(frozen=True, slots=True)
+class _ServiceSpec:
+    """Definition of a service that sends one Protocol v2 command."""
+
+    schema: vol.Schema
+    """Schema of the service call data"""
+
+    build_command: Callable[[Mapping[str, Any]], str | None]
+    """Builds the command from the call data; None skips sending"""
+
+    log_message: str
+    """Info message logged before sending, with %s placeholders"""
+
+    log_fields: tuple[str, ...]
+    """Call data fields filling the log message placeholders"""
+
+    refresh: bool = False
+    """Whether to refresh data after the command succeeded"""
+
+
+SERVICES: dict[str, _ServiceSpec] = {
+    # Command 7 is for generic commands
+    SERVICE_SEND_COMMAND: _ServiceSpec(
+        SEND_COMMAND_SCHEMA,
+        lambda data: f"7,{data['command']}",
+        "Sending command to %s: %s",
+        ("vehicle_id", "command"),
+    ),
+    # Command 40 is for sending SMS
+    SERVICE_SEND_SMS: _ServiceSpec(
+        SEND_SMS_SCHEMA,
+        lambda data: f"40,{data['phone_number']},{data['message']}",
+        "Sending SMS from %s to %s",
+        ("vehicle_id", "phone_number"),
+    ),
+    SERVICE_SET_CHARGE_TIMER: _ServiceSpec(
+        SET_CHARGE_TIMER_SCHEMA,
+        _charge_timer_command,
+        "Setting charge timer for %s to %s (enabled: %s)",
+        ("vehicle_id", "start_time", "enabled"),
+    ),
+    # Command 19 is for waking specific subsystems
+    SERVICE_WAKEUP_SUBSYSTEM: _ServiceSpec(
+        WAKEUP_SUBSYSTEM_SCHEMA,
+        lambda data: f"19,{data['subsystem']}",
+        "Waking subsystem %s for %s",
+        ("subsystem", "vehicle_id"),
+    ),
+    # TPMS mapping uses generic command
+    SERVICE_TPMS_MAP_WHEEL: _ServiceSpec(
+        TPMS_MAP_WHEEL_SCHEMA,
+        lambda data: f"7,tpms map {data['wheel']} {data['sensor_id']}",
+        "Mapping TPMS sensor %s to wheel %s for %s",
+        ("sensor_id", "wheel", "vehicle_id"),
+        refresh=True,
+    ),
+    # Commands 1-4 get and set features and parameters
+    SERVICE_GET_FEATURE: _ServiceSpec(
+        FEATURE_SCHEMA,
+        lambda data: "1",
+        "Getting feature %s for %s",
+        ("feature_number", "vehicle_id"),
+    ),
+    SERVICE_SET_FEATURE: _ServiceSpec(
+        FEATURE_SCHEMA,
+        lambda data: f"2,{data['feature_number']},{data.get('value', '')}",
+        "Setting feature %s to %s for %s",
+        ("feature_number", "value", "vehicle_id"),
+    ),
+    SERVICE_GET_PARAMETER: _ServiceSpec(
+        PARAMETER_SCHEMA,
+        lambda data: "3",
+        "Getting parameter %s for %s",
+        ("parameter_number", "vehicle_id"),
+    ),
+    SERVICE_SET_PARAMETER: _ServiceSpec(
+        PARAMETER_SCHEMA,
+        lambda data: f"4,{data['parameter_number']},{data.get('value', '')}",
+        "Setting parameter %s to %s for %s",
+        ("parameter_number", "value", "vehicle_id"),
+    ),
+}
+
+
+async def _async_handle_service(
+    hass: HomeAssistant, spec: _ServiceSpec, call: ServiceCall
+) -> None:
+    """Handle a service call by sending its command to the vehicle.
 
     Args:
         hass: Home Assistant instance
-        call: Service call data containing vehicle_id, feature_number, and value
+        spec: Definition of the called service
+        call: Service call data containing vehicle_id and service fields
     """
-    vehicle_id = call.data["vehicle_id"]
-    feature_number = call.data["feature_number"]
-    value = call.data.get("value", "")
+    data = call.data
+    vehicle_id = data["vehicle_id"]
 
     coordinator = _get_coordinator(hass, vehicle_id)
     if not coordinator:
@@ -310,155 +220,36 @@ async def async_set_feature(hass: HomeAssistant, call: ServiceCall) -> None:
         _LOGGER.error("OVMS Protocol client not available for vehicle %s", vehicle_id)
         return
 
-    try:
-        # Command 2 is for setting features
-        _LOGGER.info("Setting feature %d to %s for %s", feature_number, value, vehicle_id)
-        await coordinator.ovms_client.send_command(f"2,{feature_number},{value}")
-    except Exception as err:
-        _LOGGER.error("Failed to set feature for %s: %s", vehicle_id, err)
-
-
-async def async_get_parameter(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Handle get_parameter service call.
-
-    Gets a module parameter using Command 3.
-
-    Args:
-        hass: Home Assistant instance
-        call: Service call data containing vehicle_id and parameter_number
-    """
-    vehicle_id = call.data["vehicle_id"]
-    parameter_number = call.data["parameter_number"]
-
-    coordinator = _get_coordinator(hass, vehicle_id)
-    if not coordinator:
-        _LOGGER.error("Vehicle %s not found", vehicle_id)
-        return
-
-    if not coordinator.ovms_client:
-        _LOGGER.error("OVMS Protocol client not available for vehicle %s", vehicle_id)
+    command = spec.build_command(data)
+    if command is None:
         return
 
+    _LOGGER.info(spec.log_message, *(data.get(field, "") for field in spec.log_fields))
     try:
-        # Command 3 is for getting parameters
-        _LOGGER.info("Getting parameter %d for %s", parameter_number, vehicle_id)
-        await coordinator.ovms_client.send_command("3")
+        # Goes through the coordinator so commands are serialized and each
+        # response is matched to its command
+        sent = await coordinator.async_send_command(command, refresh=spec.refresh)
     except Exception as err:
-        _LOGGER.error("Failed to get parameter for %s: %s", vehicle_id, err)
-
-
-async def async_set_parameter(hass: HomeAssistant, call: ServiceCall) -> None:
-    """Handle set_parameter service call.
-
-    Sets a module parameter using Command 4.
-
-    Args:
-        hass: Home Assistant instance
-        call: Service call data containing vehicle_id, parameter_number, and value
-    """
-    vehicle_id = call.data["vehicle_id"]
-    parameter_number = call.data["parameter_number"]
-    value = call.data.get("value", "")
-
-    coordinator = _get_coordinator(hass, vehicle_id)
-    if not coordinator:
-        _LOGGER.error("Vehicle %s not found", vehicle_id)
+        _LOGGER.error("Failed to call %s for %s: %s", call.service, vehicle_id, err)
         return
-
-    if not coordinator.ovms_client:
-        _LOGGER.error("OVMS Protocol client not available for vehicle %s", vehicle_id)
-        return
-
-    try:
-        # Command 4 is for setting parameters
-        _LOGGER.info("Setting parameter %d to %s for %s", parameter_number, value, vehicle_id)
-        await coordinator.ovms_client.send_command(f"4,{parameter_number},{value}")
-    except Exception as err:
-        _LOGGER.error("Failed to set parameter for %s: %s", vehicle_id, err)
+    if not sent:
+        _LOGGER.error("Failed to call %s for %s", call.service, vehicle_id)
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up OVMS services."""
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SEND_COMMAND,
-        lambda call: async_send_command(hass, call),
-        schema=SEND_COMMAND_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SEND_SMS,
-        lambda call: async_send_sms(hass, call),
-        schema=SEND_SMS_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_CHARGE_TIMER,
-        lambda call: async_set_charge_timer(hass, call),
-        schema=SET_CHARGE_TIMER_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_WAKEUP_SUBSYSTEM,
-        lambda call: async_wakeup_subsystem(hass, call),
-        schema=WAKEUP_SUBSYSTEM_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_TPMS_MAP_WHEEL,
-        lambda call: async_tpms_map_wheel(hass, call),
-        schema=TPMS_MAP_WHEEL_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_GET_FEATURE,
-        lambda call: async_get_feature(hass, call),
-        schema=FEATURE_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_FEATURE,
-        lambda call: async_set_feature(hass, call),
-        schema=FEATURE_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_GET_PARAMETER,
-        lambda call: async_get_parameter(hass, call),
-        schema=PARAMETER_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_PARAMETER,
-        lambda call: async_set_parameter(hass, call),
-        schema=PARAMETER_SCHEMA,
-    )
+    for service, spec in SERVICES.items():
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            partial(_async_handle_service, hass, spec),
+            schema=spec.schema,
+        )
 
     _LOGGER.info("OVMS services registered")
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload OVMS services."""
-    services = [
-        SERVICE_SEND_COMMAND,
-        SERVICE_SEND_SMS,
-        SERVICE_SET_CHARGE_TIMER,
-        SERVICE_WAKEUP_SUBSYSTEM,
-        SERVICE_TPMS_MAP_WHEEL,
-        SERVICE_GET_FEATURE,
-        SERVICE_SET_FEATURE,
-        SERVICE_GET_PARAMETER,
-        SERVICE_SET_PARAMETER,
-    ]
-
-    for service in services:
+    for service in SERVICES:
         hass.services.async_remove(DOMAIN, service)